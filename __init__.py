@@ -1,6 +1,3 @@
-import pandas as pd
 from tidyplots import TidyPlot
 
-# Monkey patching
-if not hasattr(pd.DataFrame, 'tidyplot'):
-    pd.DataFrame.tidyplot = lambda self: TidyPlot(self)
\ No newline at end of file
+# DataFrame.tidyplot is registered as a pandas accessor by tidyplots.tidyplots on import
@@ -0,0 +1,45 @@
+"""
+Cached seaborn dataset loading shared by the example scripts.
+"""
+import os
+import pandas as pd
+import seaborn as sns
+
+CACHE_DIR = os.path.expanduser('~/.tidyplots_cache')
+
+# Bump when the cached frames change (e.g. CATEGORICAL_COLUMNS) so stale files are not reused
+CACHE_VERSION = 2
+
+# Grouping keys used by the examples, per dataset; stored as categoricals so groupby
+# hashes integer codes
+CATEGORICAL_COLUMNS = {
+    'tips': ['sex', 'smoker', 'day', 'time'],
+    'titanic': ['survived', 'class', 'sex'],
+    'diamonds': ['cut', 'color', 'clarity'],
+    'iris': ['species'],
+    'penguins': ['species', 'island', 'sex'],
+}
+
+
+def _as_categorical(name, df):
+    """Convert the known grouping columns of a dataset to categorical dtype."""
+    for col in CATEGORICAL_COLUMNS.get(name, []):
+        if df[col].dtype.name != 'category':
+            df[col] = df[col].astype('category')
+    return df
+
+
+def load_dataset(name):
+    """Load a seaborn dataset with categorical grouping keys, caching it as Feather."""
+    path = os.path.join(CACHE_DIR, f'{name}-v{CACHE_VERSION}.feather')
+    if os.path.exists(path):
+        return pd.read_feather(path)
+
+    df = _as_categorical(name, sns.load_dataset(name))
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        df.to_feather(path)
+    except ImportError:
+        # Feather needs pyarrow; without it just use seaborn's CSV cache
+        pass
+    return df
@@ -1,55 +1,68 @@
-import nbformat
+import json
 import re
 
+# Patterns used while converting cells, compiled once at import
+_TITLE_RE = re.compile(r"title='([^']*)'")
+_MULTI_US_RE = re.compile(r'_+')
+_SECTION_RE = re.compile(r'#+ (\d+\.?\d*)')
+
+class _FilenameTable(dict):
+    """str.translate table that maps every character outside [a-z0-9_] to '_'."""
+    def __missing__(self, key):
+        return '_'
+
+_FILENAME_TABLE = _FilenameTable({ord(c): c for c in 'abcdefghijklmnopqrstuvwxyz0123456789_'})
+
+# Plot types used to name figures, detected in one pass over the cell source.
+# No trailing word boundary: add_boxplot and add_density_2d must still match.
+PLOT_TYPES = ('scatter', 'line', 'bar', 'box', 'violin', 'density', 'step', 'dot',
+              'mean_bar', 'count', 'histogram', 'area', 'pie', 'heatmap')
+_PLOT_RE = re.compile(r'add_(%s)' % '|'.join(PLOT_TYPES))
+
+def _replace_show(line, section_number, plot_type):
+    # Try to extract title first
+    title_match = _TITLE_RE.search(line)
+    
+    if title_match:
+        # Use the title to generate filename
+        title = title_match.group(1).lower()
+        # Remove special characters and spaces
+        title = title.translate(_FILENAME_TABLE)
+        title = _MULTI_US_RE.sub('_', title)  # Replace multiple underscores with single
+        title = title.strip('_')  # Remove leading/trailing underscores
+        filename = f"figures/{section_number}_{title}.png"
+    else:
+        # Use plot type if available, otherwise use a generic name
+        if plot_type:
+            filename = f"figures/{section_number}_{plot_type}.png"
+        else:
+            filename = f"figures/{section_number}_plot.png"
+    
+    # Replace .show() with .save()
+    return line.replace('.show()', f".save('{filename}')")
+
 def process_code_cell(cell_source, section_number=''):
     # Replace .show() with .save() with appropriate filename
-    lines = cell_source.split('\n')
-    processed_lines = []
-    
     # Extract plot type from the code
-    plot_type = None
-    for pt in ['scatter', 'line', 'bar', 'box', 'violin', 'density', 'step', 'dot', 
-              'mean_bar', 'count', 'histogram', 'area', 'pie', 'heatmap']:
-        if f'add_{pt}' in cell_source:
-            plot_type = pt
-            break
+    plot_match = _PLOT_RE.search(cell_source)
+    plot_type = plot_match.group(1) if plot_match else None
     
-    for line in lines:
-        if '.show()' in line:
-            # Try to extract title first
-            title_match = re.search(r"title='([^']*)'", line)
-            
-            if title_match:
-                # Use the title to generate filename
-                title = title_match.group(1).lower()
-                # Remove special characters and spaces
-                title = re.sub(r'[^a-z0-9_]', '_', title)
-                title = re.sub(r'_+', '_', title)  # Replace multiple underscores with single
-                title = title.strip('_')  # Remove leading/trailing underscores
-                filename = f"figures/{section_number}_{title}.png"
-            else:
-                # Use plot type if available, otherwise use a generic name
-                if plot_type:
-                    filename = f"figures/{section_number}_{plot_type}.png"
-                else:
-                    filename = f"figures/{section_number}_plot.png"
-            
-            # Replace .show() with .save()
-            line = line.replace('.show()', f".save('{filename}')")
-        processed_lines.append(line)
+    processed_lines = [_replace_show(line, section_number, plot_type) if '.show()' in line else line
+                       for line in cell_source.split('\n')]
     return '\n'.join(processed_lines)
 
-# Read the notebook
+# Read the notebook as plain JSON; only cell types and sources are needed,
+# so nbformat's schema validation is skipped
 with open('seaborn_examples.ipynb', 'r') as f:
-    nb = nbformat.read(f, as_version=4)
+    nb = json.load(f)
 
-# Start with imports and setup
-py_code = '''"""
+# Start with imports and setup; output pieces are collected and joined once
+parts = ['''"""
 Comprehensive test of ALL functions in TidyPlots API using seaborn datasets.
 This script tests every single function documented in api.md.
 """
 import pandas as pd
-import seaborn as sns
+from _datasets import load_dataset
 import os
 import numpy as np
 import tidyplots  # Import the package which will monkey-patch pandas
@@ -57,42 +70,47 @@ import tidyplots  # Import the package which will monkey-patch pandas
 # Create figures directory if it doesn't exist
 os.makedirs("figures", exist_ok=True)
 
-# Load all available seaborn datasets
-iris = sns.load_dataset("iris")
-tips = sns.load_dataset("tips")
-titanic = sns.load_dataset("titanic")
-planets = sns.load_dataset("planets")
-diamonds = sns.load_dataset("diamonds")
-flights = sns.load_dataset("flights")
+# Load all available seaborn datasets (cached on disk after the first run)
+iris = load_dataset("iris")
+tips = load_dataset("tips")
+titanic = load_dataset("titanic")
+planets = load_dataset("planets")
+diamonds = load_dataset("diamonds")
+flights = load_dataset("flights")
 
-'''
+''']
 
 current_section = ''
-for cell in nb.cells:
-    if cell.cell_type == 'markdown':
+for cell in nb['cells']:
+    cell_type = cell['cell_type']
+    source = cell['source']
+    if isinstance(source, list):
+        source = ''.join(source)
+    if cell_type == 'markdown':
         # Process section headers
-        if cell.source.startswith('# '):
-            header = cell.source.strip()
+        if source.startswith('# '):
+            header = source.strip()
             # Extract section number if it exists
-            section_match = re.match(r'#+ (\d+\.?\d*)', header)
+            section_match = _SECTION_RE.match(header)
             if section_match:
                 current_section = section_match.group(1).rstrip('.')
-            py_code += f"\n{header}\n"
-    elif cell.cell_type == 'code':
+            parts.append(f"\n{header}\n")
+    elif cell_type == 'code':
         # Skip the pip install cell
-        if 'pip install' in cell.source:
+        if 'pip install' in source:
             continue
         # Skip the initial imports if we already have them
-        if 'import pandas' in cell.source or 'import seaborn' in cell.source:
+        if 'import pandas' in source or 'import seaborn' in source:
             continue
             
         # Process code cells
-        if cell.source.strip():
-            processed_code = process_code_cell(cell.source, current_section)
-            py_code += f"\n{processed_code}\n"
+        if source.strip():
+            processed_code = process_code_cell(source, current_section)
+            parts.append(f"\n{processed_code}\n")
 
 # Add final message
-py_code += '\nprint("\\nAll examples have been generated in the \'figures\' directory.")\n'
+parts.append('\nprint("\\nAll examples have been generated in the \'figures\' directory.")\n')
+py_code = ''.join(parts)
 
 # Write the Python file
 with open('seaborn_examples.py', 'w') as f:
@@ -3,75 +3,113 @@
 import pandas as pd
 import numpy as np
 from tidyplots import TidyPlot
+from _build import maybe_save
 import os
+import matplotlib
+from concurrent.futures import ProcessPoolExecutor
+
+# Render off-screen; the Agg backend is safe to use from worker processes
+matplotlib.use('Agg')
 
 # Create directory for figures if it doesn't exist
 os.makedirs("figures", exist_ok=True)
 
 # Generate sample data
-np.random.seed(42)
+rng = np.random.default_rng(42)
 n = 100
 data = pd.DataFrame({
-    'x': np.random.normal(0, 1, n),
-    'y': np.random.normal(0, 1, n),
-    'group': np.random.choice(['A', 'B', 'C'], n),
+    'x': rng.normal(0, 1, n),
+    'y': rng.normal(0, 1, n),
+    'group': pd.Categorical(rng.choice(['A', 'B', 'C'], n)),
     'time': pd.date_range(start='2023-01-01', periods=n),
-    'value': np.random.normal(10, 2, n)
+    'value': rng.normal(10, 2, n)
 })
 
+
 # Example 1: Time series with trend
-(data.tidyplot(x='time', y='value')
- .add_line()
- .add_scatter()
- .adjust_labels(title='Time Series Plot', x='Date', y='Value')
- .save('figures/time_series.png'))
+def time_series():
+    maybe_save(data.tidyplot(x='time', y='value')
+     .add_line()
+     .add_scatter()
+     .adjust_labels(title='Time Series Plot', x='Date', y='Value'),
+     'figures/time_series.png', __file__)
+
 
 # Example 2: Scatter plot with groups
-(data.tidyplot(x='x', y='y', color='group')
- .add_scatter()
- .adjust_labels(title='Grouped Scatter Plot', x='X', y='Y')
- .save('figures/scatter_groups.png'))
+def scatter_groups():
+    maybe_save(data.tidyplot(x='x', y='y', color='group')
+     .add_scatter()
+     .adjust_labels(title='Grouped Scatter Plot', x='X', y='Y'),
+     'figures/scatter_groups.png', __file__)
+
 
 # Example 3: Box plot with data points and p-values
-(data.tidyplot(x='group', y='y')
- .add_boxplot()
- .add_scatter(alpha=0.3)
- # .add_pvalue(0.001, 0, 2, 2.5)  # Add significance between groups A and C
- .adjust_labels(title='Box Plot with P-value', x='Group', y='Value')
- .save('figures/boxplot_jitter.png'))
+def boxplot_jitter():
+    maybe_save(data.tidyplot(x='group', y='y')
+     .add_boxplot()
+     .add_scatter(alpha=0.3)
+     # .add_pvalue(0.001, 0, 2, 2.5)  # Add significance between groups A and C
+     .adjust_labels(title='Box Plot with P-value', x='Group', y='Value'),
+     'figures/boxplot_jitter.png', __file__)
+
 
 # Example 4: Violin plot with quartiles
-(data.tidyplot(x='group', y='y')
- .add_violin(draw_quantiles=[0.25, 0.5, 0.75])
- .adjust_labels(title='Violin Plot with Quartiles', x='Group', y='Value')
- .save('figures/violin_quartiles.png'))
+def violin_quartiles():
+    maybe_save(data.tidyplot(x='group', y='y')
+     .add_violin(draw_quantiles=[0.25, 0.5, 0.75])
+     .adjust_labels(title='Violin Plot with Quartiles', x='Group', y='Value'),
+     'figures/violin_quartiles.png', __file__)
+
 
 # Example 5: Density plot with groups
-(data.tidyplot(x='y', color='group')
- .add_density(alpha=0.5)
- .adjust_labels(title='Density Plot by Group', x='Value', y='Density')
- .save('figures/density_groups.png'))
+def density_groups():
+    maybe_save(data.tidyplot(x='y', color='group')
+     .add_density(alpha=0.5)
+     .adjust_labels(title='Density Plot by Group', x='Value', y='Density'),
+     'figures/density_groups.png', __file__)
+
 
 # Example 6: 2D density plot
-(data.tidyplot(x='x', y='y')
- .add_density_2d()
- .adjust_colors('Blues')
- .adjust_labels(title='2D Density Plot', x='X', y='Y')
- .save('figures/density_2d.png'))
+def density_2d():
+    maybe_save(data.tidyplot(x='x', y='y')
+     .add_density_2d()
+     .adjust_colors('Blues')
+     .adjust_labels(title='2D Density Plot', x='X', y='Y'),
+     'figures/density_2d.png', __file__)
+
 
 # Example 7: Bar plot with error bars
-means = data.groupby('group')['y'].mean().reset_index()
-sems = data.groupby('group')['y'].sem().reset_index()
-(means.tidyplot(x='group', y='y')
- .add_bar()
- .add_errorbar(ymin=means['y']-sems['y'], ymax=means['y']+sems['y'])
- .adjust_labels(title='Bar Plot with Error Bars', x='Group', y='Value')
- .save('figures/barplot_error.png'))
+def barplot_error():
+    group_stats = (data.groupby('group', observed=True, sort=False)['y']
+                   .agg(['mean', 'sem'])
+                   .reset_index())
+    maybe_save(group_stats.tidyplot(x='group', y='mean')
+     .add_bar()
+     .add_errorbar(ymin=group_stats['mean']-group_stats['sem'],
+                   ymax=group_stats['mean']+group_stats['sem'])
+     .adjust_labels(title='Bar Plot with Error Bars', x='Group', y='Value'),
+     'figures/barplot_error.png', __file__)
+
 
 # Example 8: Correlation plot
-(data.tidyplot(x='x', y='y')
- .add_scatter()
- .add_smooth(method='lm')
- .add_correlation_text()
- .adjust_labels(title='Correlation Plot', x='X', y='Y')
- .save('figures/correlation.png'))
+def correlation():
+    maybe_save(data.tidyplot(x='x', y='y')
+     .add_scatter()
+     .add_smooth(method='lm')
+     .add_correlation_text()
+     .adjust_labels(title='Correlation Plot', x='X', y='Y'),
+     'figures/correlation.png', __file__)
+
+
+EXAMPLES = [time_series, scatter_groups, boxplot_jitter, violin_quartiles,
+            density_groups, density_2d, barplot_error, correlation]
+
+
+def _run(example):
+    example()
+
+
+if __name__ == '__main__':
+    # Every example renders an independent figure, so render them on all cores
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(_run, EXAMPLES))
@@ -1,10 +1,26 @@
 import nbformat as nbf
 import re
 
+# Section headers ('# ' or '## ' at line start) and save() calls to rewrite
+_SEC_RE = re.compile(r'^(#{1,2} .*)$', re.MULTILINE)
+_SAVE_RE = re.compile(r"\.save\([^)]+\)")
+# Per-plot function headers; notebook cells run the plot chains inline instead
+_DEF_RE = re.compile(r'^def \w+\(\):\n', re.MULTILINE)
+_INDENT_RE = re.compile(r'^    ', re.MULTILINE)
+# maybe_save(<chain>, 'figures/...', __file__, ...) wrappers around a plot chain
+_MAYBE_SAVE_RE = re.compile(r"maybe_save\((.*?),\n\s*'[^']*', __file__[^)]*\)", re.DOTALL)
+
+# Script sections covered by the setup cell below
+_SETUP_MARKERS = ['import ', 'matplotlib.use', 'rcParams', 'POINTS_DPI =', 'Create figures',
+                  'load_dataset(', 'tips_s =', 'day_tip_base =']
+
 # Read the original Python script
 with open('seaborn_examples.py', 'r') as f:
     py_script = f.read()
 
+# Drop the process-pool runner at the end of the script; the notebook runs cells in order
+py_script = py_script.split('\nPLOTS = [', 1)[0]
+
 # Create a new notebook
 nb = nbf.v4.new_notebook()
 
@@ -19,27 +35,20 @@ nb.cells.append(nbf.v4.new_code_cell('pip install -e ../'))
 # Function to process a code block
 def process_code_block(code):
     # Replace .save() with .show(), removing any parameters
-    code = re.sub(r"\.save\([^)]+\)", '.show()', code)
+    code = _SAVE_RE.sub('.show()', code)
+    code = _MAYBE_SAVE_RE.sub(r'(\1\n .show())', code)
+    # Unwrap the plot function so the cell renders the plot when run
+    if _DEF_RE.search(code):
+        code = _INDENT_RE.sub('', _DEF_RE.sub('', code))
     return code
 
-# Split the script into sections
-sections = []
-current_section = []
-lines = py_script.split('\n')
-
-for line in lines:
-    if line.startswith('# ') or line.startswith('## '):
-        if current_section:
-            sections.append(current_section)
-            current_section = []
-    current_section.append(line)
-
-if current_section:
-    sections.append(current_section)
+# Split the script into [preamble, header1, body1, header2, body2, ...] in one pass.
+# The preamble (docstring and imports) is replaced by the setup cell below.
+parts = _SEC_RE.split(py_script)
 
 # Add the initial imports and setup
 imports_code = '''import pandas as pd
-import seaborn as sns
+from _datasets import load_dataset
 import numpy as np
 import os
 import tidyplots  # Import the package which will monkey-patch pandas
@@ -47,36 +56,32 @@ import tidyplots  # Import the package which will monkey-patch pandas
 # Create figures directory if it doesn't exist
 os.makedirs("figures", exist_ok=True)
 
-# Load all available seaborn datasets
-iris = sns.load_dataset("iris")
-tips = sns.load_dataset("tips")
-titanic = sns.load_dataset("titanic")
-planets = sns.load_dataset("planets")
-diamonds = sns.load_dataset("diamonds")
-flights = sns.load_dataset("flights")'''
+# Load the seaborn datasets (cached, with categorical grouping keys)
+iris = load_dataset("iris")
+tips = load_dataset("tips")
+titanic = load_dataset("titanic")
+diamonds = load_dataset("diamonds")
+flights = load_dataset("flights")
+tips_s = tips[['day', 'tip', 'total_bill']].copy()
+day_tip_base = tips_s.tidyplot(x='day', y='tip', fill='day')'''
 
 nb.cells.append(nbf.v4.new_code_cell(imports_code))
 
 # Process each section
-for section in sections:
-    section_text = '\n'.join(section)
-    
+for header_line, body in zip(parts[1::2], parts[2::2]):
     # Skip the initial imports and setup sections
-    if any(text in section_text for text in ['import ', 'Create figures', 'Load all available']):
+    if any(text in header_line or text in body for text in _SETUP_MARKERS):
         continue
     
     # Process section header
-    header_line = section[0].strip()
-    if header_line.startswith('# ') or header_line.startswith('## '):
-        header_text = header_line.lstrip('#').strip()
-        header_level = 1 if header_line.startswith('# ') else 2
-        nb.cells.append(nbf.v4.new_markdown_cell(f"{'#' * header_level} {header_text}"))
+    header_line = header_line.strip()
+    header_text = header_line.lstrip('#').strip()
+    header_level = 1 if header_line.startswith('# ') else 2
+    nb.cells.append(nbf.v4.new_markdown_cell(f"{'#' * header_level} {header_text}"))
     
     # Process code content
-    code_lines = []
-    for line in section[1:]:
-        if line.strip() and not line.startswith('"""'):
-            code_lines.append(line)
+    code_lines = [line for line in body.split('\n')
+                  if line.strip() and not line.startswith('"""')]
     
     if code_lines:
         code = '\n'.join(code_lines).strip()
@@ -6,95 +6,103 @@ import pandas as pd
 import numpy as np
 from tidyplots import tidyplot
 from plotnine import geom_tile
+from _build import maybe_save
+
+# One seeded generator shared by all examples
+rng = np.random.default_rng(42)
 
 print("\nExample 1: Basic Heatmap (Default Palette)")
-# Create sample data
+# Create sample data; the 5x5 grid index is reused by Example 6
+idx5 = np.arange(5, dtype=np.int32)
 data = pd.DataFrame({
-    'x': np.repeat(range(5), 5),
-    'y': np.tile(range(5), 5),
-    'value': np.random.rand(25)
+    'x': np.repeat(idx5, 5),
+    'y': np.tile(idx5, 5),
+    'value': rng.random(25)
 })
 
 # Using default palette (npg)
-(data.tidyplot(x='x', y='y', fill='value')
- .add_heatmap()
- .save('figures/basic_heatmap.png'))
+maybe_save(data.tidyplot(x='x', y='y', fill='value')
+ .add_heatmap(),
+ 'figures/basic_heatmap.png', __file__)
 
 print("\nExample 2: Correlation Matrix Heatmap (NEJM)")
 # Create correlation matrix
-np.random.seed(42)
-corr_data = pd.DataFrame(np.random.randn(5, 5), columns=['A', 'B', 'C', 'D', 'E'])
+corr_data = pd.DataFrame(rng.standard_normal((5, 5)), columns=['A', 'B', 'C', 'D', 'E'])
 corr_matrix = corr_data.corr()
 
 # Convert correlation matrix to long format
-corr_long = pd.DataFrame([
-    {'x': i, 'y': j, 'value': corr_matrix.iloc[i, j]}
-    for i in range(len(corr_matrix))
-    for j in range(len(corr_matrix))
-])
+corr_values = corr_matrix.to_numpy()
+n_vars = corr_values.shape[0]
+corr_long = pd.DataFrame({
+    'x': np.repeat(np.arange(n_vars), n_vars),
+    'y': np.tile(np.arange(n_vars), n_vars),
+    'value': corr_values.ravel()
+})
 
-(corr_long.tidyplot(x='x', y='y', fill='value')
+maybe_save(corr_long.tidyplot(x='x', y='y', fill='value')
  .adjust_colors(palette='nejm')
- .add_heatmap(show_values=True)
- .save('figures/correlation_heatmap.png'))
+ .add_heatmap(show_values=True),
+ 'figures/correlation_heatmap.png', __file__)
 
 print("\nExample 3: Categorical Heatmap (Lancet)")
-# Create categorical data
+# Create categorical data; repeat/tile the integer codes rather than the labels
 categories = ['A', 'B', 'C', 'D']
+codes = np.arange(len(categories))
 data = pd.DataFrame({
-    'x': np.repeat(categories, 4),
-    'y': np.tile(categories, 4),
-    'value': np.random.randint(1, 10, 16)
+    'x': pd.Categorical.from_codes(np.repeat(codes, 4), categories),
+    'y': pd.Categorical.from_codes(np.tile(codes, 4), categories),
+    'value': rng.integers(1, 10, 16)
 })
 
-(data.tidyplot(x='x', y='y', fill='value')
+maybe_save(data.tidyplot(x='x', y='y', fill='value')
  .adjust_colors(palette='lancet')
- .add_heatmap(show_values=True, value_format='{:.0f}')
- .save('figures/categorical_heatmap.png'))
+ .add_heatmap(show_values=True, value_format='{:.0f}'),
+ 'figures/categorical_heatmap.png', __file__)
 
 print("\nExample 4: Time Series Heatmap (JCO)")
 # Create time series data
 dates = pd.date_range('2023-01-01', '2023-12-31', freq='D')
-hours = range(24)
+# Build the date x hour grid with meshgrid to keep dates as datetime64
+date_grid, hour_grid = np.meshgrid(dates.values, np.arange(24), indexing='ij')
 data = pd.DataFrame({
-    'date': np.repeat(dates, 24),
-    'hour': np.tile(hours, len(dates)),
-    'value': np.random.rand(len(dates) * 24)
+    'date': date_grid.ravel(),
+    'hour': hour_grid.ravel(),
+    'value': rng.random(date_grid.size)
 })
 
-(data.tidyplot(x='date', y='hour', fill='value')
+maybe_save(data.tidyplot(x='date', y='hour', fill='value')
  .adjust_colors(palette='jco')
- .add_heatmap()
- .save('figures/timeseries_heatmap.png'))
+ .add_heatmap(),
+ 'figures/timeseries_heatmap.png', __file__)
 
 print("\nExample 5: Custom Style Heatmap (AAAS)")
 # Create sample data with custom style
 data = pd.DataFrame({
-    'x': np.repeat(range(10), 10),
-    'y': np.tile(range(10), 10),
-    'value': np.random.rand(100)
+    'x': np.repeat(np.arange(10, dtype=np.int32), 10),
+    'y': np.tile(np.arange(10, dtype=np.int32), 10),
+    'value': rng.random(100)
 })
 
-(data.tidyplot(x='x', y='y', fill='value')
+maybe_save(data.tidyplot(x='x', y='y', fill='value')
  .adjust_colors(palette='aaas')
- .add_heatmap(alpha=0.8)
- .save('figures/custom_heatmap.png'))
+ .add_heatmap(alpha=0.8),
+ 'figures/custom_heatmap.png', __file__)
 
 print("\nExample 6: Palette Comparison")
 # Create sample data
 data = pd.DataFrame({
-    'x': np.repeat(range(5), 5),
-    'y': np.tile(range(5), 5),
-    'value': np.random.rand(25)
+    'x': np.repeat(idx5, 5),
+    'y': np.tile(idx5, 5),
+    'value': rng.random(25)
 })
 
 print("6.1: Default NPG Palette")
-(data.tidyplot(x='x', y='y', fill='value')
- .add_heatmap()
- .save('figures/palette_default.png'))
+maybe_save(data.tidyplot(x='x', y='y', fill='value')
+ .add_heatmap(),
+ 'figures/palette_default.png', __file__)
 
 print("6.2: JAMA Palette")
-(data.tidyplot(x='x', y='y', fill='value')
+maybe_save(data.tidyplot(x='x', y='y', fill='value')
  .adjust_colors(palette='jama')
- .add_heatmap()
- .save('figures/palette_jama.png'))
+ .add_heatmap(),
+ 'figures/palette_jama.png', __file__)
@@ -9,7 +9,7 @@ from tidyplots import tidyplot
 os.makedirs('../figures', exist_ok=True)
 
 # Read the data
-df = pd.read_csv('result.csv')
+df = pd.read_csv('result.csv', dtype={'dataset': 'category', 'model_name': 'category'})
 
 # 1. Box plot of CGAR by dataset
 (tidyplot(df, x='dataset', y='CGAR', color='dataset')
@@ -43,10 +43,10 @@ df = pd.read_csv('result.csv')
  .save('../figures/total_return_violin.png'))
 
 # 4. Error bar plot of average returns by model type
-model_stats = df.groupby('model_name').agg({
-    'CGAR': ['mean', 'std']
-}).reset_index()
-model_stats.columns = ['model_name', 'CGAR_mean', 'CGAR_std']
+model_stats = df.groupby('model_name', observed=True, sort=False).agg(
+    CGAR_mean=('CGAR', 'mean'),
+    CGAR_std=('CGAR', 'std')
+).reset_index()
 
 (tidyplot(model_stats, x='model_name', y='CGAR_mean')
  .add_errorbar(ymin='CGAR_mean - CGAR_std', 
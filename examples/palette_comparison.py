@@ -3,46 +3,60 @@
 import pandas as pd
 import numpy as np
 from tidyplots import TidyPlot
+from _build import maybe_save
 import os
+import matplotlib
+from concurrent.futures import ProcessPoolExecutor
+
+# Render off-screen; the Agg backend is safe to use from worker processes
+matplotlib.use('Agg')
 
 # Create directory for figures if it doesn't exist
 os.makedirs("figures", exist_ok=True)
 
 # Create sample data with multiple groups
-np.random.seed(42)
+rng = np.random.default_rng(42)
 n = 50
 palettes = ['npg', 'aaas', 'nejm', 'lancet', 'jama', 'd3', 'material', 'igv']
+groups = ['A', 'B', 'C', 'D', 'E', 'F']
 
-# Create a plot for each palette
-for i, palette in enumerate(palettes):
-    data = pd.DataFrame({
-        'x': np.random.normal(0, 1, n * 6),
-        'y': np.random.normal(0, 1, n * 6),
-        'group': np.repeat(['A', 'B', 'C', 'D', 'E', 'F'], n)
-    })
-    
-    # Create scatter plot with the current palette
-    (data.tidyplot(x='x', y='y', color='group')
+# The scatter data does not depend on the palette, so build it once
+scatter_data = pd.DataFrame({
+    'x': rng.normal(0, 1, n * 6),
+    'y': rng.normal(0, 1, n * 6),
+    'group': pd.Categorical.from_codes(np.repeat(np.arange(len(groups)), n), groups)
+})
+
+
+def render_palette(palette):
+    """Create scatter plot with the given palette."""
+    maybe_save(scatter_data.tidyplot(x='x', y='y', color='group')
      .add_scatter()
      .adjust_colors(palette)
      .adjust_labels(title=f'{palette.upper()} Color Palette',
                    x='X Value',
-                   y='Y Value')
-     .save(f'figures/palette_{palette}.png'))
-
-# Create a bar plot comparing all palettes
-data = pd.DataFrame({
-    'x': np.tile(np.arange(6), len(palettes)),
-    'y': np.random.uniform(0, 1, 6 * len(palettes)),
-    'group': np.repeat(['A', 'B', 'C', 'D', 'E', 'F'], len(palettes)),
-    'palette': np.repeat(palettes, 6)
-})
+                   y='Y Value'),
+     f'figures/palette_{palette}.png', __file__)
+
+
+if __name__ == '__main__':
+    # Create a plot for each palette; the plots are independent, so render them in parallel
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(render_palette, palettes))
+
+    # Create a bar plot comparing all palettes
+    comparison_data = pd.DataFrame({
+        'x': np.tile(np.arange(6), len(palettes)),
+        'y': rng.uniform(0, 1, 6 * len(palettes)),
+        'group': pd.Categorical.from_codes(np.repeat(np.arange(len(groups)), len(palettes)), groups),
+        'palette': pd.Categorical.from_codes(np.repeat(np.arange(len(palettes)), 6), palettes)
+    })
 
-# Create faceted bar plot
-(data.tidyplot(x='group', y='y', color='group')
- .add_bar()
- .adjust_colors('npg')  # Use NPG palette for the combined plot
- .adjust_labels(title='Scientific Color Palettes Comparison',
-               x='Group',
-               y='Value')
- .save('figures/palette_comparison.png'))
+    # Create faceted bar plot
+    maybe_save(comparison_data.tidyplot(x='group', y='y', color='group')
+     .add_bar()
+     .adjust_colors('npg')  # Use NPG palette for the combined plot
+     .adjust_labels(title='Scientific Color Palettes Comparison',
+                   x='Group',
+                   y='Value'),
+     'figures/palette_comparison.png', __file__)
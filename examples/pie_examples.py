@@ -1,5 +1,6 @@
 import pandas as pd
-import seaborn as sns
+from _datasets import load_dataset
+from _build import maybe_save
 from tidyplots import tidyplot
 from plotnine import facet_wrap
 import os
@@ -9,58 +10,64 @@ import numpy as np
 os.makedirs('figures', exist_ok=True)
 
 # Load example datasets
-titanic = sns.load_dataset('titanic')
-tips = sns.load_dataset('tips')
-diamonds = sns.load_dataset('diamonds')
+titanic = load_dataset('titanic')
+tips = load_dataset('tips')
+diamonds = load_dataset('diamonds')
 
 # Example 1: Titanic Survival Pie Chart
 print("\nExample 1: Titanic Survival Pie Chart")
-survival_counts = titanic.groupby('survived', observed=True).size().reset_index(name='count')
+# Cross-tabulate class x survival once; the overall survival counts (Examples 1 and 7),
+# per-class survival (Examples 5 and 8) and class sizes (Examples 6 and 7) are all read off it
+survival_table = pd.crosstab(titanic['class'], titanic['survived'])
+survival_counts = survival_table.sum(axis=0).reset_index(name='count')
 survival_counts['survived'] = survival_counts['survived'].map({0: 'Did Not Survive', 1: 'Survived'})
 
-(survival_counts.tidyplot(x='survived', y='count')
- .add_pie()
- .save('figures/survival_pie.png'))
+maybe_save(survival_counts.tidyplot(x='survived', y='count')
+ .add_pie(),
+ 'figures/survival_pie.png', __file__)
 
 # Example 2: Tips by day distribution as a donut chart
 print("\nExample 2: Tips by Day Donut Chart")
-day_counts = tips.groupby('day', observed=True).size().reset_index(name='count')
-
-(day_counts.tidyplot(x='day', y='count')
- .add_donut(inner_radius=0.6)
- .save('figures/tips_by_day_donut.png'))
+# One pass over tips for every per-day figure: Examples 2, 3 and 9 all slice this table
+day_stats = tips.groupby('day', observed=True).agg(
+    count=('tip', 'size'),
+    total_bill=('total_bill', 'mean'),
+    tip=('tip', 'mean')
+).reset_index()
+day_counts = day_stats[['day', 'count']]
+
+maybe_save(day_counts.tidyplot(x='day', y='count')
+ .add_donut(inner_radius=0.6),
+ 'figures/tips_by_day_donut.png', __file__)
 
 # Example 3: Tips by day as a pie chart with white edges
 print("\nExample 3: Tips by Day Pie Chart")
-class_counts = tips.groupby('day', observed=True).agg({
-    'total_bill': 'mean',
-    'tip': 'mean'
-}).reset_index()
+day_means = day_stats[['day', 'total_bill', 'tip']]
 
 # Custom colors for each slice
 colors = ['#FF9999', '#66B2FF', '#99FF99', '#FFCC99']
 
 # First chart - Total Bill
-(class_counts.tidyplot(x='day', y='total_bill')
- .add_pie(fill=colors)
- .save('figures/tips_by_day_pie.png'))
+maybe_save(day_means.tidyplot(x='day', y='total_bill')
+ .add_pie(fill=colors),
+ 'figures/tips_by_day_pie.png', __file__)
 
 # Second chart - Tips
-(class_counts.tidyplot(x='day', y='tip')
- .add_donut(inner_radius=0.7, fill=colors)
- .save('figures/tips_donut.png'))
+maybe_save(day_means.tidyplot(x='day', y='tip')
+ .add_donut(inner_radius=0.7, fill=colors),
+ 'figures/tips_donut.png', __file__)
 
 # Example 4: Diamond cut distribution as a donut chart with larger hole
 print("\nExample 4: Diamonds Cut Distribution")
 cut_counts = diamonds.groupby('cut', observed=True).size().reset_index(name='count')
 
-(cut_counts.tidyplot(x='cut', y='count')
- .add_donut(inner_radius=0.7)
- .save('figures/diamond_cut_donut.png'))
+maybe_save(cut_counts.tidyplot(x='cut', y='count')
+ .add_donut(inner_radius=0.7),
+ 'figures/diamond_cut_donut.png', __file__)
 
 # Example 5: Faceted pie charts showing survival by class
 print("\nExample 5: Titanic Survival by Class")
-survival_by_class = titanic.groupby(['class', 'survived'], observed=True).size().reset_index(name='count')
+survival_by_class = survival_table.stack().reset_index(name='count')
 # Map survived values to readable labels
 survival_labels = {0: 'Did Not Survive', 1: 'Survived'}
 survival_by_class['survived'] = survival_by_class['survived'].map(survival_labels)
@@ -71,67 +78,50 @@ plot = (survival_by_class.tidyplot(x='survived', y='count')
         .plot + facet_wrap('class', nrow=1))
 
 # Save the plot
-plot.save('figures/survival_by_class_pies.png')
+maybe_save(plot, 'figures/survival_by_class_pies.png', __file__)
 
 # Example 6: Donut chart with custom colors and very thin ring
 print("\nExample 6: Thin Ring Donut Chart")
-class_counts = titanic.groupby('class', observed=True).size().reset_index(name='count')
+class_counts = survival_table.sum(axis=1).reset_index(name='count')
 
-(class_counts.tidyplot(x='class', y='count')
- .add_donut(inner_radius=0.8, fill=['#FF9999', '#66B2FF', '#99FF99'])
- .save('figures/thin_ring_donut.png'))
+maybe_save(class_counts.tidyplot(x='class', y='count')
+ .add_donut(inner_radius=0.8, fill=['#FF9999', '#66B2FF', '#99FF99']),
+ 'figures/thin_ring_donut.png', __file__)
 
 # Example 7: Side-by-side donut charts
 print("\nExample 7: Side-by-side Donut Charts")
 # First create the class distribution donut
-(class_counts.tidyplot(x='class', y='count')
- .add_donut(inner_radius=0.6, fill=['#FF9999', '#66B2FF', '#99FF99'])
- .save('figures/class_donut.png'))
-
-# Then create the survival distribution donut
-survival_counts = titanic.groupby('survived', observed=True).size().reset_index(name='count')
-survival_counts['survived'] = survival_counts['survived'].map({0: 'Did Not Survive', 1: 'Survived'})
+maybe_save(class_counts.tidyplot(x='class', y='count')
+ .add_donut(inner_radius=0.6, fill=['#FF9999', '#66B2FF', '#99FF99']),
+ 'figures/class_donut.png', __file__)
 
-(survival_counts.tidyplot(x='survived', y='count')
- .add_donut(inner_radius=0.7, fill=['#ffcc99', '#ff99cc'])
- .save('figures/survival_donut.png'))
+# Then create the survival distribution donut, reusing the counts from Example 1
+maybe_save(survival_counts.tidyplot(x='survived', y='count')
+ .add_donut(inner_radius=0.7, fill=['#ffcc99', '#ff99cc']),
+ 'figures/survival_donut.png', __file__)
 
 # Example 8: Multiple small donut charts in a grid
 print("\nExample 8: Small Donut Charts Grid")
-# Create separate donut charts for each class
-for i, passenger_class in enumerate(titanic['class'].unique()):
-    class_survival = (
-        titanic[titanic['class'] == passenger_class]
-        .groupby('survived', observed=True)
-        .size()
-        .reset_index(name='count')
-    )
-    class_survival['survived'] = class_survival['survived'].map({0: 'Did Not Survive', 1: 'Survived'})
-    
-    (class_survival.tidyplot(x='survived', y='count')
-     .add_donut(inner_radius=0.6, fill=['#ff9999', '#66b3ff'])
-     .save(f'figures/class_{passenger_class.lower()}_survival_donut.png'))
+# Reuse the per-class survival counts from Example 5 and create a donut chart for each class
+for passenger_class, class_survival in survival_by_class.groupby('class', observed=True, sort=False):
+    maybe_save(class_survival.reset_index(drop=True).tidyplot(x='survived', y='count')
+     .add_donut(inner_radius=0.6, fill=['#ff9999', '#66b3ff']),
+     f'figures/class_{passenger_class.lower()}_survival_donut.png', __file__)
 
 # Example 9: Sorted pie chart with percentage labels
 print("\nExample 9: Sorted Pie Chart with Labels")
-day_counts = tips.groupby('day', observed=True).size().reset_index(name='count')
-
-(day_counts.tidyplot(x='day', y='count')
- .add_pie(sort=True, show_labels=True, label_type='both', label_radius=1.2, label_size=12)
- .save('figures/sorted_pie_with_labels.png'))
+maybe_save(day_counts.tidyplot(x='day', y='count')
+ .add_pie(sort=True, show_labels=True, label_type='both', label_radius=1.2, label_size=12),
+ 'figures/sorted_pie_with_labels.png', __file__)
 
 # Example 10: Exploded pie chart
 print("\nExample 10: Exploded Pie Chart")
-class_counts = titanic.groupby('class', observed=True).size().reset_index(name='count')
-
-(class_counts.tidyplot(x='class', y='count')
- .add_pie(explode=[0.1, 0.1, 0.2], start_angle=45, show_labels=True, label_type='{:.0f}', fill=['#FF9999', '#66B2FF', '#99FF99'])
- .save('figures/exploded_pie.png'))
+maybe_save(class_counts.tidyplot(x='class', y='count')
+ .add_pie(explode=[0.1, 0.1, 0.2], start_angle=45, show_labels=True, label_type='{:.0f}', fill=['#FF9999', '#66B2FF', '#99FF99']),
+ 'figures/exploded_pie.png', __file__)
 
 # Example 11: Customized donut chart
 print("\nExample 11: Customized Donut Chart")
-cut_counts = diamonds.groupby('cut', observed=True).size().reset_index(name='count')
-
-(cut_counts.tidyplot(x='cut', y='count')
- .add_donut(inner_radius=0.7, sort=True, show_labels=True, label_type='percent', label_radius=0.85, label_size=8)
- .save('figures/custom_donut.png'))
+maybe_save(cut_counts.tidyplot(x='cut', y='count')
+ .add_donut(inner_radius=0.7, sort=True, show_labels=True, label_type='percent', label_radius=0.85, label_size=8),
+ 'figures/custom_donut.png', __file__)
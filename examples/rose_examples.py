@@ -1,6 +1,7 @@
 import pandas as pd
 import numpy as np
 import tidyplots
+from _build import maybe_save
 import os
 
 # Get the absolute path to the figures directory
@@ -14,11 +15,11 @@ monthly_data = pd.DataFrame({
               190, 180, 160, 140, 120, 100]
 })
 
-(monthly_data.tidyplot(x='month', y='sales')
+maybe_save(monthly_data.tidyplot(x='month', y='sales')
  .adjust_title('Monthly Sales Distribution')
  .add_rose(show_labels=True, label_type='value')
- .adjust_colors(['#FF4B4B'])  # Use a single red color
- .save(os.path.join(FIGURES_DIR, 'rose_monthly.png')))
+ .adjust_colors(['#FF4B4B']),  # Use a single red color
+ os.path.join(FIGURES_DIR, 'rose_monthly.png'), __file__)
 
 # Example 2: Basic Rose Chart
 data = pd.DataFrame({
@@ -26,35 +27,35 @@ data = pd.DataFrame({
     'value': [30, 45, 20, 35, 25, 40]
 })
 
-(data.tidyplot(x='category', y='value')
+maybe_save(data.tidyplot(x='category', y='value')
  .adjust_title('Basic Nightingale Rose Chart')
  .add_rose(show_labels=True, label_type='both')
- .adjust_colors(['#FF4B4B'])  # Use a single red color
- .save(os.path.join(FIGURES_DIR, 'rose_basic.png')))
+ .adjust_colors(['#FF4B4B']),  # Use a single red color
+ os.path.join(FIGURES_DIR, 'rose_basic.png'), __file__)
 
 # Example 3: Sorted Rose Chart
-(data.tidyplot(x='category', y='value')
+maybe_save(data.tidyplot(x='category', y='value')
  .adjust_title('Sorted Nightingale Rose Chart')
  .add_rose(sort=True, show_labels=True, label_type='both')
- .adjust_colors(['#FF4B4B'])  # Use a single red color
- .save(os.path.join(FIGURES_DIR, 'rose_sorted.png')))
+ .adjust_colors(['#FF4B4B']),  # Use a single red color
+ os.path.join(FIGURES_DIR, 'rose_sorted.png'), __file__)
 
 # Example 4: Two-Color Rose Chart
-(data.tidyplot(x='category', y='value')
+maybe_save(data.tidyplot(x='category', y='value')
  .adjust_title('Two-Color Rose Chart')
  .add_rose(show_labels=True, label_type='value')
- .adjust_colors(['#FF4B4B', '#4B4BFF'])  # Alternate between red and blue
- .save(os.path.join(FIGURES_DIR, 'rose_colors.png')))
+ .adjust_colors(['#FF4B4B', '#4B4BFF']),  # Alternate between red and blue
+ os.path.join(FIGURES_DIR, 'rose_colors.png'), __file__)
 
 # Example 5: Many Categories
-np.random.seed(42)  # For reproducible results
+rng = np.random.default_rng(42)  # For reproducible results
 many_data = pd.DataFrame({
     'category': [f'Cat{i+1}' for i in range(12)],
-    'value': np.random.randint(20, 100, 12)
+    'value': rng.integers(20, 100, 12)
 })
 
-(many_data.tidyplot(x='category', y='value')
+maybe_save(many_data.tidyplot(x='category', y='value')
  .adjust_title('Rose Chart with Many Categories')
  .add_rose(show_labels=True, label_type='value', label_size=8)
- .adjust_colors(['#FF4B4B'])  # Use a single red color
- .save(os.path.join(FIGURES_DIR, 'rose_many.png')))
+ .adjust_colors(['#FF4B4B']),  # Use a single red color
+ os.path.join(FIGURES_DIR, 'rose_many.png'), __file__)
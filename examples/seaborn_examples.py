@@ -3,336 +3,476 @@ Comprehensive test of ALL functions in TidyPlots API using seaborn datasets.
 This script tests every single function documented in api.md.
 """
 import pandas as pd
-import seaborn as sns
+from _datasets import load_dataset
+from _build import maybe_save
 import os
 import numpy as np
 import tidyplots  # Import the package which will monkey-patch pandas
 import scipy.stats as stats
+import argparse
+import matplotlib
+from concurrent.futures import ProcessPoolExecutor
+
+# Render off-screen; the Agg backend is safe to use from worker processes
+matplotlib.use('Agg')
+# Let Agg decimate near-collinear path vertices and stroke long paths in chunks
+matplotlib.rcParams.update({
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+})
+
+# Point-heavy plots are saved below the default 100 dpi to cut PNG encoding time
+POINTS_DPI = 72
 
 # Create figures directory if it doesn't exist
 os.makedirs("figures", exist_ok=True)
 
-# Load all available seaborn datasets
-iris = sns.load_dataset("iris")
-tips = sns.load_dataset("tips")
-titanic = sns.load_dataset("titanic")
-planets = sns.load_dataset("planets")
-diamonds = sns.load_dataset("diamonds")
-flights = sns.load_dataset("flights")
+# Load the seaborn datasets used below (cached on disk after the first run)
+iris = load_dataset("iris")
+tips = load_dataset("tips")
+titanic = load_dataset("titanic")
+diamonds = load_dataset("diamonds")
+# year (1949-1960) and passengers (< 1000) fit narrow ints, halving the bytes the yearly groupby reads
+flights = load_dataset("flights").astype({'year': 'int16', 'passengers': 'int32'})
+
+# Most tips plots only need these columns; a narrow frame keeps each plot's copies small
+tips_s = tips[['day', 'tip', 'total_bill']].copy()
+# Base plot shared by every tip-by-day figure; each one clones it and adds its own layers
+day_tip_base = tips_s.tidyplot(x='day', y='tip', fill='day')
 
 # TidyPlots API Examples
 # Comprehensive test of ALL functions in TidyPlots API using seaborn datasets.
 
 # 1. Basic Plots
 
-print("\nCreating scatter plot...")
-(iris.tidyplot(x='sepal_length', y='sepal_width', fill='species')
- .add_scatter(size=5, alpha=1)
- .adjust_labels(title='Scatter: Iris Dimensions',
-               x='Sepal Length', y='Sepal Width')
- .adjust_legend_position('right')
- .save('figures/1_scatter.png'))
-
-monthly_passengers = flights.groupby('year', observed=True)['passengers'].mean().reset_index()
-(monthly_passengers.tidyplot(x='year', y='passengers', fill='year')
- .add_line(size=1, alpha=1)
- .adjust_labels(title='Line: Average Passengers by Year',
-               x='Year', y='Passengers')
- .save('figures/1_line.png'))
+def plot_1_scatter():
+    maybe_save(iris.tidyplot(x='sepal_length', y='sepal_width', fill='species')
+     .add_scatter(size=5, alpha=1)
+     .adjust_labels(title='Scatter: Iris Dimensions',
+                   x='Sepal Length', y='Sepal Width')
+     .adjust_legend_position('right'),
+     'figures/1_scatter.png', __file__, dpi=POINTS_DPI)
+
+
+monthly_passengers = flights.groupby('year', observed=True, sort=False)['passengers'].mean().reset_index()
+
+
+def plot_1_line():
+    maybe_save(monthly_passengers.tidyplot(x='year', y='passengers', fill='year')
+     .add_line(size=1, alpha=1)
+     .adjust_labels(title='Line: Average Passengers by Year',
+                   x='Year', y='Passengers'),
+     'figures/1_line.png', __file__)
+
 
 # 1.3 Bar Plot
-(tips.tidyplot(x='day', y='tip', fill='day')
- .add_bar(stat='identity', width=0.7, alpha=1)
- .adjust_labels(title='Bar: Tips by Day',
-               x='Day', y='Total Tips')
- .save('figures/1.3_bar.png'))
+def plot_1_3_bar():
+    maybe_save(day_tip_base.clone()
+     .add_bar(stat='identity', width=0.7, alpha=1)
+     .adjust_labels(title='Bar: Tips by Day',
+                   x='Day', y='Total Tips'),
+     'figures/1.3_bar.png', __file__)
+
 
 # 1.4 Box Plot
-(tips.tidyplot(x='day', y='tip', fill='day')
- .add_boxplot(alpha=1)
- .adjust_labels(title='Box: Tips by Day',
-               x='Day', y='Tips')
- .save('figures/1.4_box.png'))
+def plot_1_4_box():
+    maybe_save(day_tip_base.clone()
+     .add_boxplot(alpha=1)
+     .adjust_labels(title='Box: Tips by Day',
+                   x='Day', y='Tips'),
+     'figures/1.4_box.png', __file__)
+
 
 # 1.5 Violin Plot
-(tips.tidyplot(x='day', y='tip', fill='day')
- .add_violin(alpha=1)
- .adjust_labels(title='Violin: Tips by Day',
-               x='Day', y='Tips')
- .save('figures/1.5_violin.png'))
+def plot_1_5_violin():
+    maybe_save(day_tip_base.clone()
+     .add_violin(alpha=1)
+     .adjust_labels(title='Violin: Tips by Day',
+                   x='Day', y='Tips'),
+     'figures/1.5_violin.png', __file__)
+
 
 # 1.6 Density Plot
-(tips.tidyplot(x='total_bill', fill='time')
- .add_density(alpha=1)
- .adjust_labels(title='Density: Bill Distribution by Time',
-               x='Total Bill', y='Density')
- .save('figures/1.6_density.png'))
+def plot_1_6_density():
+    maybe_save(tips.tidyplot(x='total_bill', fill='time')
+     .add_density(alpha=1)
+     .adjust_labels(title='Density: Bill Distribution by Time',
+                   x='Total Bill', y='Density'),
+     'figures/1.6_density.png', __file__)
+
 
 # 1.7 Hex Plot
-(iris.tidyplot(x='sepal_length', y='sepal_width', fill='species')
- .add_hex(bins=20)
- .adjust_labels(title='Hex: Iris Dimensions',
-               x='Sepal Length', y='Sepal Width')
- .save('figures/1.7_hex.png'))
+def plot_1_7_hex():
+    maybe_save(iris.tidyplot(x='sepal_length', y='sepal_width')
+     .add_hex(bins=20)
+     .adjust_labels(title='Hex: Iris Dimensions',
+                   x='Sepal Length', y='Sepal Width'),
+     'figures/1.7_hex.png', __file__, dpi=POINTS_DPI)
+
 
 # 1.8 Error Bar Plot
-tips_summary = tips.groupby('day', observed=True).agg({
-    'tip': ['mean', 'std']
-}).reset_index()
-tips_summary.columns = ['day', 'mean', 'std']
-tips_summary['ymin'] = tips_summary['mean'] - tips_summary['std']
-tips_summary['ymax'] = tips_summary['mean'] + tips_summary['std']
-
-(tips_summary.tidyplot(x='day', y='mean', fill='day')
- .add_errorbar(ymin='ymin', ymax='ymax')
- .adjust_labels(title='Error Bar: Tips by Day',
-               x='Day', y='Tips (Mean ± SD)')
- .save('figures/1.8_errorbar.png'))
+# Per-day tip summary, shared by the error bar (1.8) and ribbon (4.3) plots
+tip_stats = tips.groupby('day', observed=True, sort=False)['tip'].agg(mean='mean', std='std')
+# Load mean and SD once as arrays and derive both bounds from them
+tip_mean, tip_std = tip_stats['mean'].to_numpy(), tip_stats['std'].to_numpy()
+tips_summary = tip_stats.assign(ymin=tip_mean - tip_std, ymax=tip_mean + tip_std).reset_index()
+
+def plot_1_8_errorbar():
+    maybe_save(tips_summary.tidyplot(x='day', y='mean', fill='day')
+     .add_errorbar(ymin='ymin', ymax='ymax')
+     .adjust_labels(title='Error Bar: Tips by Day',
+                   x='Day', y='Tips (Mean ± SD)'),
+     'figures/1.8_errorbar.png', __file__)
+
 
 # 1.9 Jitter Plot
-(iris.tidyplot(x='species', y='sepal_length', fill='species')
- .add_data_points_jitter(size=5, alpha=1)
- .adjust_labels(title='Jitter: Sepal Length by Species',
-               x='Species', y='Sepal Length')
- .save('figures/1.9_jitter.png'))
+def plot_1_9_jitter():
+    maybe_save(iris.tidyplot(x='species', y='sepal_length', fill='species')
+     .add_data_points_jitter(size=5, alpha=1)
+     .adjust_labels(title='Jitter: Sepal Length by Species',
+                   x='Species', y='Sepal Length'),
+     'figures/1.9_jitter.png', __file__, dpi=POINTS_DPI)
+
 
 # 2. Statistical Plots
 
-print("\nCreating statistical plots...")
 # 2.1 Mean Bar
-(tips.tidyplot(x='day', y='tip', fill='day')
- .add_mean_bar()
- .adjust_labels(title='Mean Bar: Tips by Day',
-               x='Day', y='Mean Tips')
- .save('figures/2.1_mean_bar.png'))
+def plot_2_1_mean_bar():
+    maybe_save(day_tip_base.clone()
+     .add_mean_bar()
+     .adjust_labels(title='Mean Bar: Tips by Day',
+                   x='Day', y='Mean Tips'),
+     'figures/2.1_mean_bar.png', __file__)
+
 
 # 2.2 SEM Error Bar
-(tips.tidyplot(x='day', y='tip', fill='day')
- .add_sem_errorbar()
- .adjust_labels(title='SEM Error Bar: Tips by Day',
-               x='Day', y='Tips (Mean ± SEM)')
- .save('figures/2.2_sem_errorbar.png'))
+def plot_2_2_sem_errorbar():
+    maybe_save(day_tip_base.clone()
+     .add_sem_errorbar()
+     .adjust_labels(title='SEM Error Bar: Tips by Day',
+                   x='Day', y='Tips (Mean ± SEM)'),
+     'figures/2.2_sem_errorbar.png', __file__)
+
 
 # 2.3 SD Error Bar
-(tips.tidyplot(x='day', y='tip', fill='smoker')
- .add_sd_errorbar()
- .adjust_labels(title='SD Error Bar: Tips by Day',
-               x='Day', y='Tips (Mean ± SD)')
- .save('figures/2.3_sd_errorbar.png'))
+def plot_2_3_sd_errorbar():
+    maybe_save(tips.tidyplot(x='day', y='tip', fill='smoker')
+     .add_sd_errorbar()
+     .adjust_labels(title='SD Error Bar: Tips by Day',
+                   x='Day', y='Tips (Mean ± SD)'),
+     'figures/2.3_sd_errorbar.png', __file__)
+
 
 # 2.4 CI Error Bar
-(tips.tidyplot(x='day', y='tip', fill='sex')
- .add_ci_errorbar()
- .adjust_labels(title='CI Error Bar: Tips by Day',
-               x='Day', y='Tips (Mean ± 95% CI)')
- .save('figures/2.4_ci_errorbar.png'))
+def plot_2_4_ci_errorbar():
+    maybe_save(tips.tidyplot(x='day', y='tip', fill='sex')
+     .add_ci_errorbar()
+     .adjust_labels(title='CI Error Bar: Tips by Day',
+                   x='Day', y='Tips (Mean ± 95% CI)'),
+     'figures/2.4_ci_errorbar.png', __file__)
+
 
 # 2.5 Statistical Test P-value
-(iris.tidyplot(x='species', y='sepal_length', fill='species')
- .add_boxplot()
- .add_test_pvalue(test='anova')
- .adjust_labels(title='P-value: Sepal Length by Species',
-               x='Species', y='Sepal Length')
- .save('figures/2.5_pvalue.png'))
+def plot_2_5_pvalue():
+    maybe_save(iris.tidyplot(x='species', y='sepal_length', fill='species')
+     .add_boxplot()
+     .add_test_pvalue(test='anova')
+     .adjust_labels(title='P-value: Sepal Length by Species',
+                   x='Species', y='Sepal Length'),
+     'figures/2.5_pvalue.png', __file__)
+
 
 # 2.6 Correlation Text
-(iris.tidyplot(x='sepal_length', y='sepal_width', fill='species')
- .add_scatter()
- .add_correlation_text()
- .adjust_labels(title='Correlation: Sepal Dimensions',
-               x='Sepal Length', y='Sepal Width')
- .save('figures/2.6_correlation.png'))
+def plot_2_6_correlation():
+    maybe_save(iris.tidyplot(x='sepal_length', y='sepal_width', fill='species')
+     .add_scatter()
+     .add_correlation_text()
+     .adjust_labels(title='Correlation: Sepal Dimensions',
+                   x='Sepal Length', y='Sepal Width'),
+     'figures/2.6_correlation.png', __file__, dpi=POINTS_DPI)
+
 
 # 2.7 Regression Line
-(iris.tidyplot(x='sepal_length', y='sepal_width', color='species')
- .add_scatter()
- .add_regression_line()
- .adjust_labels(title='Regression: Sepal Dimensions',
-               x='Sepal Length', y='Sepal Width')
- .save('figures/2.7_regression.png'))
+def plot_2_7_regression():
+    maybe_save(iris.tidyplot(x='sepal_length', y='sepal_width', color='species')
+     .add_scatter()
+     .add_regression_line()
+     .adjust_labels(title='Regression: Sepal Dimensions',
+                   x='Sepal Length', y='Sepal Width'),
+     'figures/2.7_regression.png', __file__, dpi=POINTS_DPI)
+
 
 # 2.8 Quantile Lines
-(iris.tidyplot(x='sepal_length', y='sepal_width', color='species')
- .add_scatter()
- .add_quantiles()
- .adjust_labels(title='Quantiles: Sepal Dimensions',
-               x='Sepal Length', y='Sepal Width')
- .save('figures/2.8_quantiles.png'))
+def plot_2_8_quantiles():
+    maybe_save(iris.tidyplot(x='sepal_length', y='sepal_width', color='species')
+     .add_scatter()
+     .add_quantiles()
+     .adjust_labels(title='Quantiles: Sepal Dimensions',
+                   x='Sepal Length', y='Sepal Width'),
+     'figures/2.8_quantiles.png', __file__, dpi=POINTS_DPI)
+
 
 # 3. Advanced Plots
 
-print("\nCreating advanced plots...")
 # 3.1 2D Density Contours
-(iris.tidyplot(x='sepal_length', y='sepal_width', color='species')
- .add_density_2d()
- .adjust_labels(title='2D Density: Sepal Dimensions',
-               x='Sepal Length', y='Sepal Width')
- .save('figures/3.1_density_2d.png'))
+def plot_3_1_density_2d():
+    maybe_save(iris.tidyplot(x='sepal_length', y='sepal_width', color='species')
+     .add_density_2d()
+     .adjust_labels(title='2D Density: Sepal Dimensions',
+                   x='Sepal Length', y='Sepal Width'),
+     'figures/3.1_density_2d.png', __file__)
+
 
 # 3.2 2D Density Filled
-(iris.tidyplot(x='sepal_length', y='sepal_width', fill='species')
- .add_density_2d_filled()
- .adjust_labels(title='2D Density Filled: Sepal Dimensions',
-               x='Sepal Length', y='Sepal Width')
- .save('figures/3.2_density_2d_filled.png'))
+def plot_3_2_density_2d_filled():
+    maybe_save(iris.tidyplot(x='sepal_length', y='sepal_width', fill='species')
+     .add_density_2d_filled()
+     .adjust_labels(title='2D Density Filled: Sepal Dimensions',
+                   x='Sepal Length', y='Sepal Width'),
+     'figures/3.2_density_2d_filled.png', __file__)
+
 
 # 3.3 Dot Plot
-(tips.tidyplot(x='total_bill', fill='time')
- .add_dotplot(binwidth=0.2, stackdir='down', binaxis='x')
- .adjust_labels(title='Dot: tips by total bill', x='total bill', y='Count')
- .save('figures/3.3_dotplot.png'))
+def plot_3_3_dotplot():
+    maybe_save(tips.tidyplot(x='total_bill', fill='time')
+     .add_dotplot(binwidth=0.2, stackdir='down', binaxis='x')
+     .adjust_labels(title='Dot: tips by total bill', x='total bill', y='Count'),
+     'figures/3.3_dotplot.png', __file__)
+
 
 # 3.4 Step Plot
-(flights.tidyplot(x='year', y='passengers', fill='year')
- .add_step()
- .adjust_labels(title='Step: Passengers Over Time',
-               x='Year', y='Passengers')
- .save('figures/3.4_step.png'))
+def plot_3_4_step():
+    maybe_save(flights.tidyplot(x='year', y='passengers', fill='year')
+     .add_step()
+     .adjust_labels(title='Step: Passengers Over Time',
+                   x='Year', y='Passengers'),
+     'figures/3.4_step.png', __file__)
+
 
 # 3.5 Rug Plot
-(iris.tidyplot(x='sepal_length', y='sepal_width', fill='species')
- .add_scatter()
- .add_rug()
- .adjust_labels(title='Rug: Sepal Dimensions',
-               x='Sepal Length', y='Sepal Width')
- .save('figures/3.5_rug.png'))
+def plot_3_5_rug():
+    maybe_save(iris.tidyplot(x='sepal_length', y='sepal_width', fill='species')
+     .add_scatter()
+     .add_rug()
+     .adjust_labels(title='Rug: Sepal Dimensions',
+                   x='Sepal Length', y='Sepal Width'),
+     'figures/3.5_rug.png', __file__, dpi=POINTS_DPI)
+
 
 # 3.6 Count Plot
-(tips.tidyplot(x='day', fill='time')
- .add_count()
- .adjust_labels(title='Count: Tips by Day',
-               x='Day', y='Count')
- .save('figures/3.6_count.png'))
+def plot_3_6_count():
+    maybe_save(tips.tidyplot(x='day', fill='time')
+     .add_count()
+     .adjust_labels(title='Count: Tips by Day',
+                   x='Day', y='Count'),
+     'figures/3.6_count.png', __file__)
+
 
 # 3.7 Beeswarm Plot
-(iris.tidyplot(x='species', y='sepal_length', fill='species')
- .add_data_points_beeswarm()
- .adjust_labels(title='Beeswarm: Sepal Length by Species',
-               x='Species', y='Sepal Length')
- .save('figures/3.7_beeswarm.png'))
+def plot_3_7_beeswarm():
+    maybe_save(iris.tidyplot(x='species', y='sepal_length', fill='species')
+     .add_data_points_beeswarm()
+     .adjust_labels(title='Beeswarm: Sepal Length by Species',
+                   x='Species', y='Sepal Length'),
+     'figures/3.7_beeswarm.png', __file__, dpi=POINTS_DPI)
+
 
 # 4. Annotations and Lines
 
-print("\nCreating annotations and lines...")
 mean_bill = tips['total_bill'].mean()
-(tips.tidyplot(x='total_bill', fill='time')
- .add_density()
- .add_vline(xintercept=mean_bill)
- .adjust_labels(title='Vertical Line: Bill Distribution',
-               x='Total Bill', y='Density')
- .save('figures/4.1_vline.png'))
+
+
+def plot_4_1_vline():
+    maybe_save(tips.tidyplot(x='total_bill', fill='time')
+     .add_density()
+     .add_vline(xintercept=mean_bill)
+     .adjust_labels(title='Vertical Line: Bill Distribution',
+                   x='Total Bill', y='Density'),
+     'figures/4.1_vline.png', __file__)
+
 
 # 4.2 Text Annotation
-(iris.tidyplot(x='sepal_length', y='sepal_width', fill='species')
- .add_scatter()
- .add_text(label='Correlation', x=5, y=4)
- .adjust_labels(title='Text: Sepal Dimensions',
-               x='Sepal Length', y='Sepal Width')
- .save('figures/4.2_text.png'))
-
-# 4.3 Ribbon Plot
-tips_summary = tips.groupby('day', observed=True).agg({
-    'tip': ['mean', 'std']
-}).reset_index()
-tips_summary.columns = ['day', 'mean', 'std']
-tips_summary['ymin'] = tips_summary['mean'] - tips_summary['std']
-tips_summary['ymax'] = tips_summary['mean'] + tips_summary['std']
-
-(tips_summary.tidyplot(x='day', y='mean', fill='day')
- .add_ribbon(ymin='ymin', ymax='ymax')
- .adjust_labels(title='Ribbon: Tips by Day',
-               x='Day', y='Tips (Mean ± SD)')
- .save('figures/4.3_ribbon.png'))
+def plot_4_2_text():
+    maybe_save(iris.tidyplot(x='sepal_length', y='sepal_width', fill='species')
+     .add_scatter()
+     .add_text(label='Correlation', x=5, y=4)
+     .adjust_labels(title='Text: Sepal Dimensions',
+                   x='Sepal Length', y='Sepal Width'),
+     'figures/4.2_text.png', __file__, dpi=POINTS_DPI)
+
+
+# 4.3 Ribbon Plot (reuses the per-day tip summary from 1.8)
+def plot_4_3_ribbon():
+    maybe_save(tips_summary.tidyplot(x='day', y='mean', fill='day')
+     .add_ribbon(ymin='ymin', ymax='ymax')
+     .adjust_labels(title='Ribbon: Tips by Day',
+                   x='Day', y='Tips (Mean ± SD)'),
+     'figures/4.3_ribbon.png', __file__)
+
 
 # 5. Theme and Style
 
-print("\nTesting theme and style modifications...")
 # 5.1 Color Palette
-(iris.tidyplot(x='species', y='sepal_length', fill='species')
- .add_boxplot()
- .adjust_colors('Set2')
- .adjust_labels(title='Custom Colors: Sepal Length by Species',
-               x='Species', y='Sepal Length')
- .save('figures/5.1_colors.png'))
+def plot_5_1_colors():
+    maybe_save(iris.tidyplot(x='species', y='sepal_length', fill='species')
+     .add_boxplot()
+     .adjust_colors('Set2')
+     .adjust_labels(title='Custom Colors: Sepal Length by Species',
+                   x='Species', y='Sepal Length'),
+     'figures/5.1_colors.png', __file__)
+
 
 # 5.2 Axis Text Angle
-(tips.tidyplot(x='day', y='tip', fill='day')
- .add_bar()
- .adjust_axis_text_angle(45)
- .adjust_labels(title='Angled Text: Tips by Day',
-               x='Day', y='Tips')
- .save('figures/5.2_text_angle.png'))
+def plot_5_2_text_angle():
+    maybe_save(day_tip_base.clone()
+     .add_bar()
+     .adjust_axis_text_angle(45)
+     .adjust_labels(title='Angled Text: Tips by Day',
+                   x='Day', y='Tips'),
+     'figures/5.2_text_angle.png', __file__)
+
 
 # 5.3 Legend Position
-(iris.tidyplot(x='sepal_length', y='sepal_width', color='species', fill='species')
- .add_scatter()
- .adjust_legend_position('top')
- .adjust_labels(title='Legend Position Test',
-               x='Sepal Length', y='Sepal Width')
- .save('figures/5.3_legend_position.png'))
+def plot_5_3_legend_position():
+    maybe_save(iris.tidyplot(x='sepal_length', y='sepal_width', color='species', fill='species')
+     .add_scatter()
+     .adjust_legend_position('top')
+     .adjust_labels(title='Legend Position Test',
+                   x='Sepal Length', y='Sepal Width'),
+     'figures/5.3_legend_position.png', __file__, dpi=POINTS_DPI)
+
 
 # 5.4 No Legend
-(iris.tidyplot(x='sepal_length', y='sepal_width', color='species', fill='species')
- .add_scatter()
- .remove_legend()
- .adjust_labels(title='No Legend Test',
-               x='Sepal Length', y='Sepal Width')
- .save('figures/5.4_no_legend.png'))
+def plot_5_4_no_legend():
+    maybe_save(iris.tidyplot(x='sepal_length', y='sepal_width', color='species', fill='species')
+     .add_scatter()
+     .remove_legend()
+     .adjust_labels(title='No Legend Test',
+                   x='Sepal Length', y='Sepal Width'),
+     'figures/5.4_no_legend.png', __file__, dpi=POINTS_DPI)
+
 
 # 6. Additional Features
 
-print("\nTesting additional features...")
 # 6.1 Faceting by Single Variable
-(tips.tidyplot(x='day', y='tip', fill='day', split_by='time')
- .add_boxplot()
- .adjust_labels(title='Faceted Box Plot: Tips by Day and Time',
-               x='Day', y='Tips')
- .save('figures/6.1_facet_single.png'))
+def plot_6_1_facet_single():
+    maybe_save(tips.tidyplot(x='day', y='tip', fill='day', split_by='time')
+     .add_boxplot()
+     .adjust_labels(title='Faceted Box Plot: Tips by Day and Time',
+                   x='Day', y='Tips'),
+     'figures/6.1_facet_single.png', __file__)
+
 
 # 6.2 Sorting
-diamonds_sorted = diamonds.copy()
-(diamonds_sorted.tidyplot(x='cut', fill='cut')
- .add_bar(stat='count')
- .sort_x_axis_labels(ascending=True)
- .adjust_axis_text_angle(45)
- .adjust_labels(title='Sorted Bar Plot: Diamond Cuts',
-               x='Cut', y='Count')
- .save('figures/6.2_sorting.png'))
+def plot_6_2_sorting():
+    # Plotting only reads the frame, so no defensive copy of diamonds is needed
+    maybe_save(diamonds.tidyplot(x='cut', fill='cut')
+     .add_bar(stat='count')
+     .sort_x_axis_labels(ascending=True)
+     .adjust_axis_text_angle(45)
+     .adjust_labels(title='Sorted Bar Plot: Diamond Cuts',
+                   x='Cut', y='Count'),
+     'figures/6.2_sorting.png', __file__)
+
 
 # 7. Statistical Summaries
 
-print("\nTesting statistical summaries...")
 # 7.1 Sum Bar
-(tips.tidyplot(x='day', y='tip', fill='day')
- .add_sum_bar()
- .adjust_labels(title='Sum Bar: Total Tips by Day',
-               x='Day', y='Total Tips')
- .save('figures/7.1_sum_bar.png'))
+def plot_7_1_sum_bar():
+    maybe_save(day_tip_base.clone()
+     .add_sum_bar()
+     .adjust_labels(title='Sum Bar: Total Tips by Day',
+                   x='Day', y='Total Tips'),
+     'figures/7.1_sum_bar.png', __file__)
+
 
 # 7.2 Median Bar
-(tips.tidyplot(x='day', y='tip', fill='day')
- .add_median_bar()
- .adjust_labels(title='Median Bar: Median Tips by Day',
-               x='Day', y='Median Tips')
- .save('figures/7.2_median_bar.png'))
+def plot_7_2_median_bar():
+    maybe_save(day_tip_base.clone()
+     .add_median_bar()
+     .adjust_labels(title='Median Bar: Median Tips by Day',
+                   x='Day', y='Median Tips'),
+     'figures/7.2_median_bar.png', __file__)
+
 
 # 8. Stacked Plots
 
-print("\nCreating stacked plots...")
-survival_data = titanic.groupby(['class', 'survived'], observed=True).size().reset_index(name='count')
+survival_data = titanic.groupby(['class', 'survived'], observed=True, sort=False).size().reset_index(name='count')
 
 # 8.1 Absolute Stacked Bar
-(survival_data.tidyplot(x='class', y='count', fill='survived')
- .add_barstack_absolute()
- .adjust_labels(title='Stacked Bar: Survival by Class',
-               x='Class', y='Count')
- .save('figures/8.1_stack_absolute.png'))
+def plot_8_1_stack_absolute():
+    maybe_save(survival_data.tidyplot(x='class', y='count', fill='survived')
+     .add_barstack_absolute()
+     .adjust_labels(title='Stacked Bar: Survival by Class',
+                   x='Class', y='Count'),
+     'figures/8.1_stack_absolute.png', __file__)
 
-# 8.2 Relative Stacked Bar
-(survival_data.tidyplot(x='class', y='count', fill='survived')
- .add_barstack_relative()
- .adjust_labels(title='Relative Stacked Bar: Survival by Class',
-               x='Class', y='Proportion')
- .save('figures/8.2_stack_relative.png'))
 
-print("\nAll examples have been generated in the 'figures' directory.")
+# 8.2 Relative Stacked Bar
+def plot_8_2_stack_relative():
+    maybe_save(survival_data.tidyplot(x='class', y='count', fill='survived')
+     .add_barstack_relative()
+     .adjust_labels(title='Relative Stacked Bar: Survival by Class',
+                   x='Class', y='Proportion'),
+     'figures/8.2_stack_relative.png', __file__)
+
+
+PLOTS = [
+    plot_1_scatter,
+    plot_1_line,
+    plot_1_3_bar,
+    plot_1_4_box,
+    plot_1_5_violin,
+    plot_1_6_density,
+    plot_1_7_hex,
+    plot_1_8_errorbar,
+    plot_1_9_jitter,
+    plot_2_1_mean_bar,
+    plot_2_2_sem_errorbar,
+    plot_2_3_sd_errorbar,
+    plot_2_4_ci_errorbar,
+    plot_2_5_pvalue,
+    plot_2_6_correlation,
+    plot_2_7_regression,
+    plot_2_8_quantiles,
+    plot_3_1_density_2d,
+    plot_3_2_density_2d_filled,
+    plot_3_3_dotplot,
+    plot_3_4_step,
+    plot_3_5_rug,
+    plot_3_6_count,
+    plot_3_7_beeswarm,
+    plot_4_1_vline,
+    plot_4_2_text,
+    plot_4_3_ribbon,
+    plot_5_1_colors,
+    plot_5_2_text_angle,
+    plot_5_3_legend_position,
+    plot_5_4_no_legend,
+    plot_6_1_facet_single,
+    plot_6_2_sorting,
+    plot_7_1_sum_bar,
+    plot_7_2_median_bar,
+    plot_8_1_stack_absolute,
+    plot_8_2_stack_relative,
+]
+
+
+def _run(plot):
+    plot()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--only', nargs='+', metavar='NAME',
+                        help="render only plots whose function name contains NAME, e.g. '2_8'")
+    args = parser.parse_args()
+    plots = [plot for plot in PLOTS
+             if not args.only or any(name in plot.__name__ for name in args.only)]
+
+    # Every plot is independent, so render them across all cores
+    with ProcessPoolExecutor() as executor:
+        list(executor.map(_run, plots))
+
+    print("\nAll examples have been generated in the 'figures' directory.")
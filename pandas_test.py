@@ -4,9 +4,10 @@ import numpy as np
 print("Successfully imported pandas and numpy!")
 
 # Create a simple dataframe
+rng = np.random.default_rng(42)
 df = pd.DataFrame({
-    'x': np.random.normal(0, 1, 5),
-    'y': np.random.normal(0, 1, 5),
+    'x': rng.normal(0, 1, 5),
+    'y': rng.normal(0, 1, 5),
     'group': ['A', 'B', 'A', 'B', 'C']
 })
 
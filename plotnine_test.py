@@ -14,10 +14,11 @@ except ImportError as e:
 
 # Create a simple dataframe
 try:
+    rng = np.random.default_rng(42)
     df = pd.DataFrame({
-        'x': np.random.normal(0, 1, 100),
-        'y': np.random.normal(0, 1, 100),
-        'group': np.random.choice(['A', 'B', 'C'], 100)
+        'x': rng.normal(0, 1, 100),
+        'y': rng.normal(0, 1, 100),
+        'group': rng.choice(['A', 'B', 'C'], 100)
     })
     print("Successfully created test dataframe!")
 except Exception as e:
@@ -0,0 +1,30 @@
+import matplotlib
+matplotlib.use('Agg')
+import pandas as pd
+import numpy as np
+from tidyplots import tidyplot
+import os
+
+# Create figures directory if it doesn't exist
+os.makedirs('figures', exist_ok=True)
+
+# Generate clustered sample data
+rng = np.random.default_rng(42)
+n = 600
+data = pd.DataFrame({
+    'x': rng.normal(0, 1, n),
+    'y': rng.normal(0, 1, n),
+    'group': pd.Categorical(rng.choice(['A', 'B', 'C'], n))
+})
+
+# Hexbin plot colored by count
+hex_plot = (data.tidyplot(x='x', y='y')
+ .add_hex(bins=20)
+ .adjust_labels(title='Hexbin Density', x='X', y='Y')
+ .save('figures/hex_plot.png'))
+
+# A fill mapping must not split the bins or add a legend without swatches
+hex_fill_plot = (data.tidyplot(x='x', y='y', fill='group')
+ .add_hex(bins=20)
+ .adjust_labels(title='Hexbin Density with Fill Mapping', x='X', y='Y')
+ .save('figures/hex_fill_plot.png'))
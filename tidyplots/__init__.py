@@ -3,14 +3,15 @@ TidyPlots: A Python library for creating beautiful and customizable plots.
 """
 
 from .tidyplots import TidyPlot
-from .plotnine import geom_pie, geom_rose
+from .plotnine import geom_pie, geom_rose, geom_hex
 
 __version__ = '0.1.0'
 __all__ = [
     'TidyPlot',
     'tidyplot',
     'geom_pie',
-    'geom_rose'
+    'geom_rose',
+    'geom_hex'
 ]
 
 # Create tidyplot function for direct import
@@ -16,8 +16,12 @@ from typing import List, Tuple, Optional, Union, Literal
 
 def _hex_to_rgb(hex_color: str) -> Tuple[float, float, float]:
     """Convert hex color to RGB tuple."""
-    hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i+2], 16)/255 for i in (0, 2, 4))
+    # Parse the RRGGBB digits once (ignoring any alpha) and unpack with shifts
+    digits = hex_color.lstrip('#')[:6]
+    if len(digits) != 6:
+        raise ValueError(f"Expected a '#RRGGBB' color, got {hex_color!r}")
+    value = int(digits, 16)
+    return ((value >> 16) & 0xFF) / 255, ((value >> 8) & 0xFF) / 255, (value & 0xFF) / 255
 
 def _rgb_to_hex(rgb: Tuple[float, float, float]) -> str:
     """Convert RGB tuple to hex color."""
@@ -30,11 +34,11 @@ def _interpolate_colors(color1: str, color2: str, n: int) -> List[str]:
     rgb1 = _hex_to_rgb(color1)
     rgb2 = _hex_to_rgb(color2)
     
-    r = np.linspace(rgb1[0], rgb2[0], n)
-    g = np.linspace(rgb1[1], rgb2[1], n)
-    b = np.linspace(rgb1[2], rgb2[2], n)
+    # Interpolate all three channels at once into an (n, 3) array and
+    # truncate to 0-255 the same way _rgb_to_hex does
+    rgb = (np.linspace(rgb1, rgb2, n) * 255).astype(int)
     
-    return [_rgb_to_hex((r[i], g[i], b[i])) for i in range(n)]
+    return ['#{:02x}{:02x}{:02x}'.format(*c) for c in rgb.tolist()]
 
 def _create_sequential_gradient(color: str, n: int) -> List[str]:
     """Create a sequential gradient from white to a color."""
@@ -214,7 +218,8 @@ def get_palette(name: str,
     if name not in PALETTES:
         raise ValueError(f"Unknown palette '{name}'. Available palettes: {sorted(PALETTES.keys())}")
     
-    palette = PALETTES[name].copy()
+    # Read-only: every branch below returns a new list, so no defensive copy
+    palette = PALETTES[name]
     
     # 检查索引是否有效
     if i >= len(palette):
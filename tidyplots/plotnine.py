@@ -3,7 +3,9 @@ Plotnine-specific geoms and stats for TidyPlots.
 """
 
 import numpy as np
+import pandas as pd
 import matplotlib.patches as mpatches
+from matplotlib.collections import PatchCollection
 import matplotlib.pyplot as plt
 from plotnine.geoms.geom import geom
 from plotnine.layer import Layers, layer
@@ -47,18 +49,25 @@ class geom_pie(geom):
         if self.params['sort']:
             data = data.sort_values('y', ascending=False)
         
-        # Convert values to angles
-        total = data['y'].sum()
-        data['angle'] = data['y'] / total * 2 * np.pi
-        data['cumsum'] = data['angle'].cumsum()
-        data['percent'] = data['y'] / total * 100
+        # Convert values to angles; the share of the total is divided out
+        # once and reused for both the angles and the percentages
+        y = data['y'].to_numpy(dtype=float)
+        share = y / y.sum()
+        angle = share * (2 * np.pi)
+        cumsum = np.cumsum(angle)
         
         # Calculate start and end angles
         start_angle_rad = np.radians(self.params['start_angle'])
-        data['start'] = data['cumsum'].shift(1, fill_value=0) - start_angle_rad
-        data['end'] = data['cumsum'] - start_angle_rad
         
-        return data
+        # Add all derived columns in one step rather than assigning into a
+        # possibly sorted copy column by column
+        return data.assign(
+            angle=angle,
+            cumsum=cumsum,
+            percent=share * 100,
+            start=cumsum - angle - start_angle_rad,
+            end=cumsum - start_angle_rad
+        )
 
     @staticmethod
     def draw_group(data, panel_params, coord, ax, **params):
@@ -85,7 +94,9 @@ class geom_pie(geom):
         elif len(explode) < len(data):
             explode = explode + [0] * (len(data) - len(explode))
         
-        # Draw wedges
+        # Build all wedges first and add them as one collection rather than
+        # one patch artist per slice
+        wedges = []
         for i, row in data.iterrows():
             # Calculate center offset for exploded wedges
             angle = (row['start'] + row['end']) / 2
@@ -103,7 +114,7 @@ class geom_pie(geom):
                 linewidth=row['size'],
                 alpha=row['alpha']
             )
-            ax.add_patch(wedge)
+            wedges.append(wedge)
             
             # Add labels if requested
             if show_labels:
@@ -127,6 +138,8 @@ class geom_pie(geom):
                     bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', pad=1)
                 )
                 
+        ax.add_collection(PatchCollection(wedges, match_original=True))
+        
         # Set axis limits and aspect
         ax.set_xlim(-1.5, 1.5)  # Wider limits to accommodate exploded wedges
         ax.set_ylim(-1.5, 1.5)
@@ -169,15 +182,17 @@ class geom_rose(geom):
         # Convert values to angles
         n = len(data)
         angle = 2 * np.pi / n
-        data['angle'] = angle
-        data['start'] = np.arange(n) * angle - np.radians(self.params['start_angle'])
-        data['end'] = data['start'] + angle
+        start = np.arange(n) * angle - np.radians(self.params['start_angle'])
         
         # Calculate percentages
         total = data['y'].sum()
-        data['percent'] = data['y'] / total * 100
         
-        return data
+        return data.assign(
+            angle=angle,
+            start=start,
+            end=start + angle,
+            percent=data['y'] / total * 100
+        )
 
     @staticmethod
     def draw_group(data, panel_params, coord, ax, **params):
@@ -196,7 +211,8 @@ class geom_rose(geom):
         label_radius = params.get('label_radius', 0.7)
         label_size = params.get('label_size', 8)
         
-        # Draw wedges
+        # Build all wedges first and add them as one collection
+        wedges = []
         for _, row in data.iterrows():
             # Calculate radius based on value
             radius = np.sqrt(row['y'])
@@ -209,7 +225,7 @@ class geom_rose(geom):
                 linewidth=row['size'],
                 alpha=row['alpha']
             )
-            ax.add_patch(wedge)
+            wedges.append(wedge)
             
             # Add labels if requested
             if show_labels:
@@ -234,6 +250,8 @@ class geom_rose(geom):
                     bbox=dict(facecolor='white', alpha=0.7, edgecolor='none', pad=1)
                 )
         
+        ax.add_collection(PatchCollection(wedges, match_original=True))
+        
         # Draw grid lines (concentric circles)
         max_radius = np.sqrt(data['y'].max())
         for r in np.linspace(0, max_radius, 5)[1:]:
@@ -246,3 +264,59 @@ class geom_rose(geom):
         ax.set_aspect('equal')
         
         return ax
+
+
+class geom_hex(geom):
+    """
+    Create a hexagonal binning plot.
+    
+    The counts and all hexagons are produced by matplotlib's hexbin in one
+    vectorized pass and drawn as a single PolyCollection, instead of building
+    one polygon per cell in Python.
+    
+    All points in a panel are binned together, so a fill or color mapping
+    does not split the hexagons by group. Cells are colored by count through
+    ``cmap``; there is no count color bar, and TidyPlot.add_hex turns the
+    layer's legend off so mapped groups are not listed without swatches.
+    
+    Args:
+        bins (int): Number of hexagons in the x-direction
+        cmap (str): Matplotlib colormap used for the counts
+        mincnt (int): Only draw cells with at least this many points
+        **kwargs: Additional arguments passed to geom
+    """
+    DEFAULT_AES = {'alpha': 1, 'color': None, 'fill': None, 'size': 0.1}
+    REQUIRED_AES = {'x', 'y'}
+    DEFAULT_PARAMS = {
+        'na_rm': False,
+        'bins': 30,
+        'cmap': 'viridis',
+        'mincnt': 1,
+        'stat': 'identity',
+        'position': 'identity'
+    }
+
+    def draw_panel(self, data, panel_params, coord, ax, **params):
+        # Bin the whole panel at once; per-group hexbins would each get their
+        # own count normalisation and overlap one another
+        params = {**self.params, **params}
+        edgecolor = data['color'].iloc[0]
+        ax.hexbin(
+            data['x'].to_numpy(dtype=float),
+            data['y'].to_numpy(dtype=float),
+            gridsize=params.get('bins', 30),
+            cmap=params.get('cmap', 'viridis'),
+            mincnt=params.get('mincnt', 1),
+            alpha=data['alpha'].iloc[0],
+            edgecolors='face' if pd.isna(edgecolor) else edgecolor,
+            linewidths=data['size'].iloc[0],
+            # plotnine's layer-level raster=True, for vector output formats
+            rasterized=params.get('raster', False)
+        )
+        
+        return ax
+
+    @staticmethod
+    def draw_legend(data, da, lyr):
+        # Cells are colored by count, not by the mapped groups; leave the key empty
+        return da
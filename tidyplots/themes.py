@@ -1,6 +1,8 @@
 """Themes and statistical annotations for TidyPlots."""
 
-from plotnine import *
+from plotnine import (
+    theme, theme_minimal, element_text, element_line, element_rect, element_blank
+)
 from typing import List, Any
 
 class TidyPrism:
@@ -40,8 +40,16 @@ import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 import os
+import copy
+import functools
 import matplotlib.path as mpath
-from .plotnine import geom_pie, geom_rose
+from .plotnine import geom_pie, geom_rose, geom_hex
+
+
+@functools.lru_cache(maxsize=256)
+def _t_critical(ci, n):
+    """Two-sided t critical value for a ``ci`` interval over ``n`` observations."""
+    return stats.t.ppf((1 + ci) / 2, n - 1)
 
 @pd.api.extensions.register_dataframe_accessor("tidyplot")
 class TidyPlotAccessor:
@@ -74,11 +82,8 @@ class TidyPlot:
         self.prism = themes.TidyPrism()
         self._default_theme = self.prism.theme_prism()  # 设置默认主题为 theme_prism
         self._default_palette = 'npg'  # 设置默认调色板为 npg
-<<<<<<< HEAD
-        self._split_by = None  # Store split_by for later use
+        self._arrays = {}  # float64 copies of numeric columns, see _column_values
         self._faceting_applied = False  # Track if faceting has been applied
-    
-=======
         
         # Initialize the plot with basic aesthetics
         mapping_dict = {}
@@ -105,7 +110,6 @@ class TidyPlot:
         if 'color' in mapping_dict:
             self.plot = self.plot + scale_color_manual(values=colors)
         
->>>>>>> 63d4dc58a5715a83d97d9456fcfd923b282b44a6
     def __call__(self, x: str, y: str = None, 
                 color: Optional[str] = None, 
                 fill: Optional[str] = None,
@@ -185,9 +189,14 @@ class TidyPlot:
         self.plot = self.plot + geom_density(alpha=alpha)
         return self
     
-    def add_hex(self, bins: int = 20):
-        """Add hexagonal binning."""
-        self.plot = self.plot + geom_hex(bins=bins)
+    def add_hex(self, bins: int = 20, **kwargs):
+        """Add hexagonal binning.
+        
+        Cells are colored by point count, so the layer draws no legend; a fill
+        or color mapping on the plot does not split the bins.
+        """
+        kwargs.setdefault('show_legend', False)
+        self.plot = self.plot + geom_hex(bins=bins, **kwargs)
         return self
     
     def add_errorbar(self, ymin: str, ymax: str, alpha: float = 0.8, width: float = 0.2):
@@ -217,10 +226,16 @@ class TidyPlot:
     def add_sd_errorbar(self, width: float = 0.2):
         """Add error bars showing standard deviation."""
         def sd_fun(x):
+            # One pass for the mean, one dot product over the deviations for
+            # the SD; np.std would recompute the mean on its own
+            x = np.asarray(x, dtype=float)
+            mean = x.mean()
+            dev = x - mean
+            sd = np.sqrt(dev.dot(dev) / x.size)
             return pd.DataFrame({
-                'y': [np.mean(x)],
-                'ymin': [np.mean(x) - np.std(x)],
-                'ymax': [np.mean(x) + np.std(x)]
+                'y': [mean],
+                'ymin': [mean - sd],
+                'ymax': [mean + sd]
             })
         self.plot = self.plot + stat_summary(fun_data=sd_fun, geom='errorbar', width=width)
         return self
@@ -228,10 +243,13 @@ class TidyPlot:
     def add_ci_errorbar(self, width: float = 0.2, ci: float = 0.95):
         """Add error bars showing confidence interval."""
         def ci_fun(x):
-            mean = np.mean(x)
-            sem = np.std(x, ddof=1) / np.sqrt(len(x))
-            ci_factor = stats.t.ppf((1 + ci) / 2, len(x) - 1)
-            ci_width = ci_factor * sem
+            x = np.asarray(x, dtype=float)
+            n = x.size
+            mean = x.mean()
+            dev = x - mean
+            sem = np.sqrt(dev.dot(dev) / ((n - 1) * n))
+            # Groups of equal size share one t quantile across facets and redraws
+            ci_width = _t_critical(ci, n) * sem
             return pd.DataFrame({
                 'y': [mean],
                 'ymin': [mean - ci_width],
@@ -249,18 +267,23 @@ class TidyPlot:
         x = mapping['x']
         y = mapping['y']
         
+        # One pass splits y by x level; the keys come out in order of first
+        # appearance, which is also where the label goes
+        grouped = {name: group.to_numpy()
+                   for name, group in self._obj.groupby(x, observed=True, sort=False)[y]}
+        x_levels = list(grouped)
+        groups = list(grouped.values())
+        
         if test == 'anova':
-            groups = [group for name, group in self._obj.groupby(x)[y]]
             f_stat, p_val = stats.f_oneway(*groups)
         else:
-            group1, group2 = [group for name, group in self._obj.groupby(x)[y]]
+            group1, group2 = groups
             if paired:
                 t_stat, p_val = stats.ttest_rel(group1, group2)
             else:
                 t_stat, p_val = stats.ttest_ind(group1, group2)
         
-        y_max = self._obj[y].max()
-        x_levels = self._obj[x].unique()
+        y_max = np.nanmax(self._column_values(y))
         x_pos = len(x_levels) // 2  # Position text above middle category
         
         self.plot = self.plot + annotate('text', x=x_levels[x_pos], y=y_max * 1.1,
@@ -273,16 +296,21 @@ class TidyPlot:
             raise ValueError("method must be 'pearson' or 'spearman'")
         
         mapping = self.plot.mapping
-        x = mapping['x']
-        y = mapping['y']
-        
+        # The test and the label position share the cached column arrays
+        x = self._column_values(mapping['x'])
+        y = self._column_values(mapping['y'])
+        # Drop incomplete pairs in one pass; scipy would otherwise return NaN
+        complete = ~(np.isnan(x) | np.isnan(y))
+        x, y = x[complete], y[complete]
+        
+        # The label shows the p-value too, so the scipy tests are still needed
         if method == 'pearson':
-            r, p = stats.pearsonr(self._obj[x], self._obj[y])
+            r, p = stats.pearsonr(x, y)
         else:
-            r, p = stats.spearmanr(self._obj[x], self._obj[y])
+            r, p = stats.spearmanr(x, y)
         
-        y_max = self._obj[y].max()
-        x_mean = np.mean(self._obj[x])
+        y_max = y.max()
+        x_mean = x.mean()
         self.plot = self.plot + annotate('text', x=x_mean, y=y_max * 1.1,
                                        label=f'r = {r:{format}}\np = {p:{format}}')
         return self
@@ -298,29 +326,25 @@ class TidyPlot:
         x = mapping['x']
         y = mapping['y']
         
-        for q in quantiles:
-            # Calculate quantile values for each x
-            df = pd.DataFrame()
-            for x_val in sorted(self._obj[x].unique()):
-                y_vals = self._obj[self._obj[x] == x_val][y]
-                df = pd.concat([df, pd.DataFrame({
-                    x: [x_val],
-                    y: [np.quantile(y_vals, q)]
-                })])
-            
-            # Add line for this quantile
-            self.plot = self.plot + geom_line(data=df, mapping=aes(x=x, y=y),
-                                            alpha=alpha, color=color)
+        # Every quantile of every x level in one grouped pass
+        df = (self._obj.groupby(x, observed=True)[y]
+              .quantile(quantiles)
+              .rename_axis([x, 'quantile'])
+              .reset_index())
+        
+        # One line layer, split into a line per quantile
+        self.plot = self.plot + geom_line(data=df, mapping=aes(x=x, y=y, group='quantile'),
+                                        alpha=alpha, color=color)
         return self
 
-    def add_density_2d(self, alpha: float = 0.6):
+    def add_density_2d(self, alpha: float = 0.6, **kwargs):
         """Add 2D density contours."""
-        self.plot = self.plot + stat_density_2d(geom='polygon', alpha=alpha)
+        self.plot = self.plot + stat_density_2d(geom='polygon', alpha=alpha, **kwargs)
         return self
     
-    def add_density_2d_filled(self, alpha: float = 0.6):
+    def add_density_2d_filled(self, alpha: float = 0.6, **kwargs):
         """Add filled 2D density contours."""
-        self.plot = self.plot + stat_density_2d(aes(fill='..level..'), geom='polygon', alpha=alpha)
+        self.plot = self.plot + stat_density_2d(aes(fill='..level..'), geom='polygon', alpha=alpha, **kwargs)
         return self
 
     def add_dotplot(self, binwidth: float = 0.2, stackdir: str = 'up', binaxis: str = 'x'):
@@ -419,6 +443,27 @@ class TidyPlot:
         self.plot = self.plot + theme(legend_position='none')
         return self
 
+    def clone(self):
+        """Return an independent copy of this plot for building a variant.
+        
+        Adding a layer to a plotnine ggplot already returns a new ggplot, so a
+        shallow copy is enough: layers added to the clone never reach the
+        original. This lets several figures share one base set up once.
+        """
+        return copy.copy(self)
+
+    def _column_values(self, name):
+        """Return a numeric column as a float64 array, converted once per plot.
+        
+        Missing values (including nullable-dtype NA) become NaN. Only used for
+        numeric aesthetics; grouping columns stay in the DataFrame.
+        """
+        values = self._arrays.get(name)
+        if values is None:
+            values = self._obj[name].to_numpy(dtype=np.float64, na_value=np.nan)
+            self._arrays[name] = values
+        return values
+
     def _apply_faceting(self):
         """Apply faceting to the plot if not already applied."""
         if not self._faceting_applied and self._split_by is not None:
@@ -427,7 +472,6 @@ class TidyPlot:
                 self.plot = self.plot + facet_wrap(f"~ {self._split_by}")
             elif isinstance(self._split_by, (list, tuple)) and len(self._split_by) == 2:
                 # Two variables use facet_grid with rows and cols
-                from plotnine.facets import facet_grid
                 self.plot = self.plot + facet_grid(rows=self._split_by[0], cols=self._split_by[1])
             else:
                 raise ValueError("split_by must be either a string or a list/tuple of two strings")
@@ -438,65 +482,43 @@ class TidyPlot:
         # Apply faceting if needed
         self._apply_faceting()
         
-        # Draw the plot first if needed
-        if self.plot is not None:
-            self.plot.draw()
-            
         # For matplotlib-based plots (pie charts)
-        if hasattr(self, 'fig') and self.fig is not None:
-            import matplotlib.pyplot as plt
+        if self.fig is not None:
             plt.show()
-        # For plotnine-based plots
-        elif hasattr(self, 'plot') and self.plot is not None:
+        # For plotnine-based plots; ggplot.show() draws the figure itself, so
+        # drawing it beforehand only rendered (and leaked) a second figure
+        elif self.plot is not None:
             self.plot.show()
         else:
             raise ValueError("No plot to show. Create a plot first using one of the add_* methods.")
             
         return self
     
-<<<<<<< HEAD
-    def save(self, filename: str, **kwargs):
+    def save(self, filepath, **kwargs):
         """Save the plot to a file.
-        
-        Args:
-            filename (str): Path to save the plot to
-            **kwargs: Additional arguments passed to plt.savefig() or plotnine.save()
+
+        Extra keyword arguments (e.g. ``dpi``) are passed to ``savefig``.
         """
-        # Apply faceting if needed
-        self._apply_faceting()
-        
-        # Draw the plot first if needed
-        if self.plot is not None:
-            self.plot.draw()
-            
-        # For matplotlib-based plots (pie charts)
-        if hasattr(self, 'fig') and self.fig is not None:
-            self.fig.savefig(filename, **kwargs)
-            import matplotlib.pyplot as plt
-            plt.close(self.fig)
-        # For plotnine-based plots
-        elif hasattr(self, 'plot') and self.plot is not None:
-            self.plot.save(filename, **kwargs)
-        else:
-            raise ValueError("No plot to save. Create a plot first using one of the add_* methods.")
-=======
-    def save(self, filepath):
-        """Save the plot to a file."""
         # Create directory if it doesn't exist
         dirpath = os.path.dirname(filepath)
         if dirpath:  # Only create directories if path contains them
             os.makedirs(dirpath, exist_ok=True)
->>>>>>> 63d4dc58a5715a83d97d9456fcfd923b282b44a6
         
-        if self.fig:  # For matplotlib-based plots (pie charts)
-            self.fig.savefig(filepath, bbox_inches='tight')
-        elif self.plot:  # For plotnine-based plots
-            # Draw the plot
+        # Apply faceting if needed
+        self._apply_faceting()
+        kwargs.setdefault('bbox_inches', 'tight')
+        
+        if self.fig is not None:  # For matplotlib-based plots (pie charts)
+            self.fig.savefig(filepath, **kwargs)
+            plt.close(self.fig)
+        elif self.plot is not None:  # For plotnine-based plots
+            # Draw the plot once and save that figure
             fig = self.plot.draw()
-            # Save the figure
-            fig.savefig(filepath, bbox_inches='tight')
+            fig.savefig(filepath, **kwargs)
             # Close the figure to free memory
             plt.close(fig)
+        else:
+            raise ValueError("No plot to save. Create a plot first using one of the add_* methods.")
         return self
 
     def add_sum_bar(self, width: float = 0.7, alpha: float = 0.7):
@@ -579,10 +601,12 @@ class TidyPlot:
     def add_range_ribbon(self, alpha: float = 0.2, color='grey', **kwargs):
         """Add ribbon showing range."""
         def range_fun(x):
+            # Reduce on the raw array once instead of dispatching through pandas three times
+            x = np.asarray(x)
             return pd.DataFrame({
-                'y': [np.mean(x)],
-                'ymin': [np.min(x)],
-                'ymax': [np.max(x)]
+                'y': [x.mean()],
+                'ymin': [x.min()],
+                'ymax': [x.max()]
             })
         self.plot = self.plot + stat_summary(fun_data=range_fun, geom='ribbon', alpha=alpha, color=color, **kwargs)
         return self
@@ -590,10 +614,13 @@ class TidyPlot:
     def add_sd_ribbon(self, alpha: float = 0.2, color: str = 'grey', **kwargs):
         """Add ribbon showing standard deviation."""
         def sd_fun(x):
+            # Reduce once per group and reuse the mean and SD for both bounds
+            x = np.asarray(x)
+            mean, sd = x.mean(), x.std()
             return pd.DataFrame({
-                'y': [np.mean(x)],
-                'ymin': [np.mean(x) - np.std(x)],
-                'ymax': [np.mean(x) + np.std(x)]
+                'y': [mean],
+                'ymin': [mean - sd],
+                'ymax': [mean + sd]
             })
         self.plot = self.plot + stat_summary(fun_data=sd_fun, geom='ribbon', alpha=alpha, color=color, **kwargs)
         return self
@@ -895,291 +922,3 @@ class TidyPlot:
         )
         
         return self
-
-    def add_curve_fit(self):
-        """Add fitted curve."""
-        self.plot = self.plot + stat_smooth(method='loess', se=False)
-        return self
-
-    def add_sem_ribbon(self, alpha: float = 0.2, color: str = 'grey', **kwargs):
-        """Add ribbon showing standard error of mean."""
-        self.plot = self.plot + stat_smooth(method='loess', se=True, alpha=alpha, color=color, **kwargs)
-        return self
-
-    def add_range_ribbon(self, alpha: float = 0.2, color='grey', **kwargs):
-        """Add ribbon showing range."""
-        def range_fun(x):
-            return pd.DataFrame({
-                'y': [np.mean(x)],
-                'ymin': [np.min(x)],
-                'ymax': [np.max(x)]
-            })
-        self.plot = self.plot + stat_summary(fun_data=range_fun, geom='ribbon', alpha=alpha, color=color, **kwargs)
-        return self
-
-    def add_sd_ribbon(self, alpha: float = 0.2, color: str = 'grey', **kwargs):
-        """Add ribbon showing standard deviation."""
-        def sd_fun(x):
-            return pd.DataFrame({
-                'y': [np.mean(x)],
-                'ymin': [np.mean(x) - np.std(x)],
-                'ymax': [np.mean(x) + np.std(x)]
-            })
-        self.plot = self.plot + stat_summary(fun_data=sd_fun, geom='ribbon', alpha=alpha, color=color, **kwargs)
-        return self
-
-    def add_ci95_ribbon(self, alpha: float = 0.2, color='grey', **kwargs):
-        """Add ribbon showing 95% confidence interval."""
-        self.plot = self.plot + stat_smooth(method='lm', se=True, alpha=alpha, color=color, **kwargs)
-        return self
-
-    def add_barstack_absolute(self, stat: str = 'identity', width: float = 0.7, alpha: float = 0.7, **kwargs):
-        """Add stacked bars (absolute)."""
-        self.plot = self.plot + geom_bar(stat=stat, width=width, alpha=alpha, **kwargs)
-        return self
-
-    def add_barstack_relative(self, width: float = 0.7, alpha: float = 0.7, **kwargs):
-        """Add stacked bars (relative)."""
-        self.plot = self.plot + geom_bar(stat='identity', position='fill', width=width, alpha=alpha, **kwargs)
-        return self
-
-    def add_areastack_absolute(self, alpha: float = 0.7, **kwargs):
-        """Add stacked areas (absolute)."""
-        self.plot = self.plot + geom_area(position='stack', alpha=alpha, **kwargs)
-        return self
-
-    def add_areastack_relative(self, alpha: float = 0.7, **kwargs):
-        """Add stacked areas (relative)."""
-        self.plot = self.plot + geom_area(position='fill', alpha=alpha, **kwargs)
-        return self
-
-    def add_pie(self, **kwargs):
-        """
-        Add a pie chart layer to the plot.
-        
-        Args:
-            show_labels (bool): Whether to show labels
-            label_type (str): Type of labels ('value', 'percent', 'both')
-            label_radius (float): Position of labels as fraction of radius
-            label_size (float): Font size for labels
-            sort (bool): Whether to sort slices by value
-            start_angle (float): Starting angle in degrees
-            inner_radius (float): Inner radius for donut chart
-            **kwargs: Additional arguments passed to geom_pie
-            
-        Returns:
-            TidyPlot: The plot object for method chaining
-        """
-        self.plot = self.plot + geom_pie(**kwargs)
-        return self
-
-    def add_donut(self, inner_radius=0.6, **kwargs):
-        """
-        Add a donut chart layer to the plot.
-        
-        Args:
-            inner_radius (float): Inner radius as fraction of outer radius
-            **kwargs: Additional arguments passed to add_pie
-            
-        Returns:
-            TidyPlot: The plot object for method chaining
-        """
-        return self.add_pie(inner_radius=inner_radius, **kwargs)
-
-    def add_rose(self, **kwargs):
-        """
-        Add a Nightingale Rose Chart layer to the plot.
-        
-        Args:
-            show_labels (bool): Whether to show labels
-            label_type (str): Type of labels ('value', 'percent', 'both')
-            label_radius (float): Position of labels as fraction of radius
-            label_size (float): Font size for labels
-            sort (bool): Whether to sort slices by value
-            start_angle (float): Starting angle in degrees
-            **kwargs: Additional arguments passed to geom_rose
-            
-        Returns:
-            TidyPlot: The plot object for method chaining
-        """
-        self.plot = self.plot + geom_rose(**kwargs)
-        return self
-
-    def adjust_title(self, text: str, size: float = 14):
-        """Modify plot title."""
-        self.plot = self.plot + theme(plot_title=element_text(size=size)) + labs(title=text)
-        return self
-    
-    def adjust_x_axis_title(self, text: str, size: float = 11):
-        """Modify x axis title."""
-        self.plot = self.plot + theme(axis_title_x=element_text(size=size)) + labs(x=text)
-        return self
-
-    def adjust_y_axis_title(self, text: str, size: float = 11):
-        """Modify y axis title."""
-        self.plot = self.plot + theme(axis_title_y=element_text(size=size)) + labs(y=text)
-        return self
-
-    def adjust_caption(self, text: str, size: float = 10):
-        """Modify plot caption."""
-        self.plot = self.plot + theme(plot_caption=element_text(size=size)) + labs(caption=text)
-        return self
-
-    def adjust_size(self, width: float, height: float):
-        """Modify plot size."""
-        self.plot = self.plot + theme(figure_size=(width, height))
-        return self
-
-    def adjust_padding(self, left: float = 0.1, right: float = 0.1, top: float = 0.1, bottom: float = 0.1):
-        """Modify plot padding."""
-        # Convert the values to a tuple of numbers in inches
-        margin = (top, right, bottom, left)
-        self.plot = self.plot + theme(plot_margin=margin)
-        return self
-    
-    def adjust_x_axis(self, limits: tuple = None, breaks: list = None, labels: list = None):
-        """Modify x axis properties."""
-        if limits:
-            self.plot = self.plot + scale_x_continuous(limits=limits)
-        if breaks:
-            self.plot = self.plot + scale_x_continuous(breaks=breaks)
-        if labels:
-            self.plot = self.plot + scale_x_continuous(labels=labels)
-        return self
-
-    def adjust_y_axis(self, limits: tuple = None, breaks: list = None, labels: list = None):
-        """Modify y axis properties."""
-        if limits:
-            self.plot = self.plot + scale_y_continuous(limits=limits)
-        if breaks:
-            self.plot = self.plot + scale_y_continuous(breaks=breaks)
-        if labels:
-            self.plot = self.plot + scale_y_continuous(labels=labels)
-        return self
-
-    def rename_y_axis_labels(self, mapping: dict):
-        """Rename y axis labels."""
-        self.plot = self.plot + scale_y_discrete(labels=mapping)
-        return self
-
-    def rename_x_axis_labels(self, mapping: Dict[str, str]):
-        """Rename x-axis labels using a mapping dictionary."""
-        self.plot = self.plot + scale_x_discrete(labels=mapping)
-        return self
-
-    def rename_color_labels(self, mapping: dict):
-        """Rename color labels."""
-        if 'color' in self.plot.mapping:
-            self.plot = self.plot + scale_color_discrete(labels=mapping)
-        else:
-            self.plot = self.plot + scale_fill_discrete(labels=mapping)
-        return self
-
-    def reorder_x_axis_labels(self, order: list):
-        """Reorder x axis labels."""
-        self.plot = self.plot + scale_x_discrete(limits=order)
-        return self
-
-    def reorder_y_axis_labels(self, order: list):
-        """Reorder y axis labels."""
-        self.plot = self.plot + scale_y_discrete(limits=order)
-        return self
-
-    def reorder_color_labels(self, order: list):
-        """Reorder color labels."""
-        if 'color' in self.plot.mapping:
-            self.plot = self.plot + scale_color_discrete(limits=order)
-        else:
-            self.plot = self.plot + scale_fill_discrete(limits=order)
-        return self
-
-    def sort_x_axis_labels(self, ascending: bool = True):
-        """Sort x axis labels."""
-        x = self.plot.mapping['x']
-        order = sorted(self._obj[x].unique(), reverse=not ascending)
-        return self.reorder_x_axis_labels(order)
-
-    def sort_y_axis_labels(self, ascending: bool = True):
-        """Sort y axis labels."""
-        y = self.plot.mapping['y']
-        order = sorted(self._obj[y].unique(), reverse=not ascending)
-        return self.reorder_y_axis_labels(order)
-
-    def sort_color_labels(self, ascending: bool = True):
-        """Sort color labels."""
-        if 'color' in self.plot.mapping:
-            color = self.plot.mapping['color']
-            order = sorted(self._obj[color].unique(), reverse=not ascending)
-        else:
-            color = self.plot.mapping.get('fill')
-            if color:
-                order = sorted(self._obj[color].unique(), reverse=not ascending)
-            else:
-                return self
-        return self.reorder_color_labels(order)
-
-    def reverse_x_axis_labels(self):
-        """Reverse x axis labels."""
-        x = self.plot.mapping['x']
-        order = list(reversed(self._obj[x].unique()))
-        return self.reorder_x_axis_labels(order)
-
-    def reverse_y_axis_labels(self):
-        """Reverse y axis labels."""
-        y = self.plot.mapping['y']
-        order = list(reversed(self._obj[y].unique()))
-        return self.reorder_y_axis_labels(order)
-
-    def reverse_color_labels(self):
-        """Reverse color labels."""
-        if 'color' in self.plot.mapping:
-            color = self.plot.mapping['color']
-            order = list(reversed(self._obj[color].unique()))
-        else:
-            color = self.plot.mapping.get('fill')
-            if color:
-                order = list(reversed(self._obj[color].unique()))
-            else:
-                return self
-        return self.reorder_color_labels(order)
-
-    def add_pvalue(self,p: float, x1: float, x2: float, y: float, height: float = 0.02,
-                  format: str = "stars") -> List[Any]:
-        """Add p-value annotation with bracket.
-        
-        Parameters:
-        -----------
-        p : float
-            P-value to display
-        x1, x2 : float
-            x-coordinates for bracket ends
-        y : float
-            y-coordinate for bracket
-        height : float
-            Height of the bracket
-        format : str
-            Format for p-value display ('stars' or 'numeric')
-            
-        Returns:
-        --------
-        list
-            List of annotation layers
-        """
-        if format == "stars":
-            if p < 0.001:
-                text = "***"
-            elif p < 0.01:
-                text = "**"
-            elif p < 0.05:
-                text = "*"
-            else:
-                text = "ns"
-        else:
-            text = f"p = {p:.3f}"
-            
-        return [
-            geom_segment(aes(x=x1, xend=x1, y=y, yend=y+height)),
-            geom_segment(aes(x=x2, xend=x2, y=y, yend=y+height)),
-            geom_segment(aes(x=x1, xend=x2, y=y+height, yend=y+height)),
-            annotate("text", x=(x1+x2)/2, y=y+height, label=text, size=8)
-        ]